@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Cache de resultados de validación
+Memoiza validadores puros indexando por la huella (blake2b) del contenido analizado
+"""
+
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+def huella_contenido(contenido: str) -> bytes:
+    """Huella compacta (16 bytes) del contenido de un archivo"""
+    return hashlib.blake2b(contenido.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def memoizar_por_contenido(maxsize: int = 512) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorador LRU para métodos validadores que sólo dependen del contenido recibido
+
+    Los argumentos se enlazan con la firma del método (da igual pasarlos por
+    posición o por nombre) y la clave es la tupla de sus huellas en el orden de
+    la firma (se ignora `self`, las reglas no guardan estado mutable), así que un
+    archivo sin cambios se valida una sola vez aunque llegue en objetos `str`
+    distintos. Es seguro entre hilos. Los resultados cacheados se comparten por
+    referencia: deben ser inmutables.
+    """
+    def decorador(metodo: Callable[..., Any]) -> Callable[..., Any]:
+        cache: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        candado = threading.Lock()
+        firma = inspect.signature(metodo)
+
+        @functools.wraps(metodo)
+        def envoltura(*args: Any, **kwargs: Any) -> Any:
+            enlazados = firma.bind(*args, **kwargs)
+            enlazados.apply_defaults()
+            # arguments sigue el orden de la firma; el primero es self
+            _, *contenidos = enlazados.arguments.values()
+            clave = tuple(huella_contenido(contenido) for contenido in contenidos)
+            with candado:
+                if clave in cache:
+                    cache.move_to_end(clave)
+                    return cache[clave]
+            resultado = metodo(*enlazados.args, **enlazados.kwargs)
+            with candado:
+                cache[clave] = resultado
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return resultado
+
+        def cache_clear() -> None:
+            with candado:
+                cache.clear()
+
+        envoltura.cache_clear = cache_clear
+        return envoltura
+    return decorador
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Características de locals.tf
+Vector de indicadores calculado una sola vez por contenido y compartido por las reglas B2 y A7
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from .escaneo_literales import EscanerLiterales
+
+# Convención de nomenclatura: el patrón es un literal puro
+NOMENCLATURA = "${var.client}-${var.project}-${var.environment}"
+
+_ESCANER_LOCALS = EscanerLiterales(("resource_names", NOMENCLATURA, "flatten(", "for"))
+
+
+@dataclass(frozen=True)
+class CaracteristicasLocals:
+    """Indicadores de presencia de los tokens de locals.tf que consultan las reglas"""
+    tiene_resource_names: bool
+    tiene_nomenclatura: bool
+    tiene_flatten: bool
+    tiene_for: bool
+
+
+@lru_cache(maxsize=64)
+def extraer_caracteristicas_locals(contenido_locals: str) -> CaracteristicasLocals:
+    """Escanear locals.tf una vez y devolver sus indicadores (cacheado por contenido)"""
+    presentes = _ESCANER_LOCALS.presentes(contenido_locals)
+    return CaracteristicasLocals(
+        tiene_resource_names="resource_names" in presentes,
+        tiene_nomenclatura=NOMENCLATURA in presentes,
+        tiene_flatten="flatten(" in presentes,
+        tiene_for="for" in presentes
+    )
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Escaneo multi-literal
+Detecta en una sola pasada cuáles de un conjunto fijo de literales aparecen en un texto
+"""
+
+from typing import Container, Dict, FrozenSet, Iterable
+
+try:
+    import ahocorasick  # pyahocorasick (opcional)
+except ImportError:  # pragma: no cover - depende del entorno
+    ahocorasick = None
+
+
+class _PresenciaPerezosa:
+    """Presencia de literales resuelta bajo demanda: cada literal se busca la primera vez que se consulta"""
+
+    __slots__ = ("_texto", "_consultados")
+
+    def __init__(self, texto: str):
+        self._texto = texto
+        self._consultados: Dict[str, bool] = {}
+
+    def __contains__(self, literal: str) -> bool:
+        presente = self._consultados.get(literal)
+        if presente is None:
+            presente = self._consultados[literal] = literal in self._texto
+        return presente
+
+
+class EscanerLiterales:
+    """Conjunto fijo de literales buscados a la vez sobre un mismo texto
+
+    Con `pyahocorasick` instalado se construye un autómata Aho-Corasick y el
+    texto se recorre una sola vez para todos los literales. Sin la dependencia
+    se usa `str.__contains__` por literal, que en CPython es más rápido que
+    una alternancia de expresiones regulares sobre el mismo texto.
+    """
+
+    def __init__(self, literales: Iterable[str]):
+        self.literales = tuple(dict.fromkeys(literales))
+        # El autómata nunca informa el literal vacío (que siempre está, en la posición 0):
+        # se deja fuera y se agrega aparte a cada resultado
+        self._incluye_vacio = "" in self.literales
+        no_vacios = tuple(literal for literal in self.literales if literal)
+        self._total_automata = len(no_vacios)
+        self._automata = None
+        if ahocorasick is not None and no_vacios:
+            automata = ahocorasick.Automaton()
+            for literal in no_vacios:
+                automata.add_word(literal, literal)
+            automata.make_automaton()
+            self._automata = automata
+
+    def presentes(self, texto: str) -> FrozenSet[str]:
+        """Literales que aparecen al menos una vez en el texto"""
+        if self._automata is None:
+            return frozenset(literal for literal in self.literales if literal in texto)
+        encontrados = set()
+        for _, literal in self._automata.iter(texto):
+            encontrados.add(literal)
+            if len(encontrados) == self._total_automata:
+                break
+        if self._incluye_vacio:
+            encontrados.add("")
+        return frozenset(encontrados)
+
+    def presencia(self, texto: str) -> Container[str]:
+        """Literales presentes para consultar con `in`
+
+        Con autómata es el conjunto de `presentes()` (una sola pasada).
+        Sin él cada literal se busca sólo al consultarlo, así las comprobaciones
+        que miran primero el recurso no recorren el texto buscando sus dependientes.
+        """
+        if self._automata is None:
+            return _PresenciaPerezosa(texto)
+        return self.presentes(texto)
+
+    def posiciones(self, texto: str) -> Dict[str, int]:
+        """Índice de la primera aparición de cada literal presente (los ausentes no figuran)"""
+        if self._automata is None:
+            encontrados = {}
+            for literal in self.literales:
+                posicion = texto.find(literal)
+                if posicion != -1:
+                    encontrados[literal] = posicion
+            return encontrados
+        encontrados = {"": 0} if self._incluye_vacio else {}
+        pendientes = self._total_automata
+        # Las coincidencias llegan ordenadas por posición final, así que la primera
+        # de cada literal es también la de menor inicio
+        for fin, literal in self._automata.iter(texto):
+            if literal not in encontrados:
+                encontrados[literal] = fin - len(literal) + 1
+                pendientes -= 1
+                if not pendientes:
+                    break
+        return encontrados
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Mensajes de validación
+Los validadores registran códigos con sus argumentos; el texto se genera sólo al presentarlo
+"""
+
+from enum import Enum
+from typing import Any, Dict, NamedTuple, Tuple
+
+
+class CodigoMensaje(str, Enum):
+    """Código estable de cada error/advertencia (serializa como su nombre)"""
+
+    # REGLA B1: Estructura obligatoria
+    B1_ARCHIVO_FALTANTE = "B1_ARCHIVO_FALTANTE"
+    B1_ARCHIVO_SAMPLE_FALTANTE = "B1_ARCHIVO_SAMPLE_FALTANTE"
+    B1_DIRECTORIO_SAMPLE_FALTANTE = "B1_DIRECTORIO_SAMPLE_FALTANTE"
+    B1_ESTRUCTURA_INCORRECTA = "B1_ESTRUCTURA_INCORRECTA"
+
+    # REGLA B2: Convenciones de nomenclatura
+    B2_SIN_RESOURCE_NAMES = "B2_SIN_RESOURCE_NAMES"
+    B2_NOMENCLATURA_NO_IMPLEMENTADA = "B2_NOMENCLATURA_NO_IMPLEMENTADA"
+    B2_MAIN_SIN_RESOURCE_NAMES = "B2_MAIN_SIN_RESOURCE_NAMES"
+
+    # REGLA B3: Variables obligatorias
+    B3_VARIABLE_SIN_DESCRIPTION = "B3_VARIABLE_SIN_DESCRIPTION"
+    B3_ENVIRONMENT_SIN_VALIDACION = "B3_ENVIRONMENT_SIN_VALIDACION"
+    B3_VARIABLE_FALTANTE = "B3_VARIABLE_FALTANTE"
+
+    # REGLA B4: Etiquetado
+    B4_DEFAULT_TAGS_EN_MODULO = "B4_DEFAULT_TAGS_EN_MODULO"
+    B4_SIN_MERGE = "B4_SIN_MERGE"
+    B4_SIN_NAME = "B4_SIN_NAME"
+    B4_SIN_ADDITIONAL_TAGS = "B4_SIN_ADDITIONAL_TAGS"
+
+    # REGLA B5: Sample funcional
+    B5_TFVARS_FALTA_VARIABLE = "B5_TFVARS_FALTA_VARIABLE"
+    B5_TFVARS_PLACEHOLDERS = "B5_TFVARS_PLACEHOLDERS"
+    B5_TFVARS_ERROR_LECTURA = "B5_TFVARS_ERROR_LECTURA"
+    B5_TFVARS_FALTANTE = "B5_TFVARS_FALTANTE"
+    B5_README_FALTANTE = "B5_README_FALTANTE"
+
+    # REGLA A1: Tipos de datos inteligentes
+    A1_MAP_OBJECT = "A1_MAP_OBJECT"
+    A1_LIST_OBJECT = "A1_LIST_OBJECT"
+    A1_MAP_STRING_TAGS = "A1_MAP_STRING_TAGS"
+
+    # REGLA A2: for_each obligatorio
+    A2_COUNT_PROHIBIDO = "A2_COUNT_PROHIBIDO"
+    A2_RECURSO_SIN_FOR_EACH = "A2_RECURSO_SIN_FOR_EACH"
+
+    # REGLA A3: Validaciones en variables críticas
+    A3_VARIABLE_SIN_VALIDACION = "A3_VARIABLE_SIN_VALIDACION"
+    A3_ENVIRONMENT_SIN_CONTAINS = "A3_ENVIRONMENT_SIN_CONTAINS"
+    A3_SIN_REGEX = "A3_SIN_REGEX"
+
+    # REGLA A4: Configuración del provider
+    A4_SIN_PROVIDER_AWS = "A4_SIN_PROVIDER_AWS"
+    A4_SIN_REQUIRED_VERSION = "A4_SIN_REQUIRED_VERSION"
+    A4_VERSION_TERRAFORM = "A4_VERSION_TERRAFORM"
+    A4_SIN_REQUIRED_PROVIDERS = "A4_SIN_REQUIRED_PROVIDERS"
+    A4_VERSION_AWS = "A4_VERSION_AWS"
+
+    # REGLA A5: Outputs descriptivos
+    A5_OUTPUT_SIN_DESCRIPTION = "A5_OUTPUT_SIN_DESCRIPTION"
+    A5_OUTPUT_SIN_FOR_EACH = "A5_OUTPUT_SIN_FOR_EACH"
+
+    # REGLA A7: Transformaciones simples en locals
+    A7_FLATTEN_COMPLEJO = "A7_FLATTEN_COMPLEJO"
+    A7_DEMASIADO_COMPLEJA = "A7_DEMASIADO_COMPLEJA"
+    A7_SIN_RESOURCE_NAMES = "A7_SIN_RESOURCE_NAMES"
+
+    # REGLA D1: Estructura del README.md
+    D1_SECCION_FALTANTE = "D1_SECCION_FALTANTE"
+    D1_ORDEN_SECCIONES = "D1_ORDEN_SECCIONES"
+    D1_ELEMENTO_FALTANTE = "D1_ELEMENTO_FALTANTE"
+    D1_SIN_EJEMPLO_BASICO = "D1_SIN_EJEMPLO_BASICO"
+    D1_SIN_EJEMPLO_AVANZADO = "D1_SIN_EJEMPLO_AVANZADO"
+
+    # REGLA D2: Formato del CHANGELOG.md
+    D2_ELEMENTO_FALTANTE = "D2_ELEMENTO_FALTANTE"
+    D2_SIN_VERSIONES = "D2_SIN_VERSIONES"
+    D2_SECCIONES_NA = "D2_SECCIONES_NA"
+
+    # REGLA D3: Documentación de sample/
+    D3_ELEMENTO_FALTANTE = "D3_ELEMENTO_FALTANTE"
+    D3_SIN_COMANDO = "D3_SIN_COMANDO"
+    D3_SIN_TFVARS = "D3_SIN_TFVARS"
+
+    # REGLA D4: terraform-docs y descriptions
+    D4_TFDOCS_FALTANTE = "D4_TFDOCS_FALTANTE"
+    D4_TFDOCS_ERROR_LECTURA = "D4_TFDOCS_ERROR_LECTURA"
+    D4_TFDOCS_CLAVE_FALTANTE = "D4_TFDOCS_CLAVE_FALTANTE"
+    D4_TFDOCS_SIN_MARCADORES = "D4_TFDOCS_SIN_MARCADORES"
+    D4_VARIABLE_SIN_DESCRIPTION = "D4_VARIABLE_SIN_DESCRIPTION"
+    D4_OUTPUT_SIN_DESCRIPTION = "D4_OUTPUT_SIN_DESCRIPTION"
+
+    # Validación de documentación en lote (ReglasDocumentacion.validar_lote)
+    D_LOTE_TIPO_NO_RECONOCIDO = "D_LOTE_TIPO_NO_RECONOCIDO"
+    D_LOTE_ERROR_EJECUCION = "D_LOTE_ERROR_EJECUCION"
+
+    # REGLA S1: Cifrado obligatorio
+    S1_SIN_ENCRYPTION_ENABLED = "S1_SIN_ENCRYPTION_ENABLED"
+    S1_ENCRYPTION_DEFAULT_FALSE = "S1_ENCRYPTION_DEFAULT_FALSE"
+    S1_S3_SIN_CIFRADO = "S1_S3_SIN_CIFRADO"
+    S1_RDS_SIN_CIFRADO = "S1_RDS_SIN_CIFRADO"
+    S1_KMS_SIN_ROTACION = "S1_KMS_SIN_ROTACION"
+
+    # REGLA S2: Acceso público bloqueado
+    S2_SIN_BLOCK_PUBLIC_ACCESS = "S2_SIN_BLOCK_PUBLIC_ACCESS"
+    S2_S3_SIN_PUBLIC_ACCESS_BLOCK = "S2_S3_SIN_PUBLIC_ACCESS_BLOCK"
+    S2_CONFIGURACION_PUBLICA = "S2_CONFIGURACION_PUBLICA"
+    S2_SECURITY_GROUP_ABIERTO = "S2_SECURITY_GROUP_ABIERTO"
+
+    # REGLA S3: SSL/TLS forzado
+    S3_S3_SIN_FORCE_SSL = "S3_S3_SIN_FORCE_SSL"
+    S3_HTTP_INSEGURO = "S3_HTTP_INSEGURO"
+    S3_SSL_DESHABILITADO = "S3_SSL_DESHABILITADO"
+    S3_LB_SIN_HTTPS = "S3_LB_SIN_HTTPS"
+
+    # REGLA S4: Políticas de menor privilegio
+    S4_SIN_POLICY_STATEMENTS = "S4_SIN_POLICY_STATEMENTS"
+    S4_STATEMENT_SIN_SID_EFFECT = "S4_STATEMENT_SIN_SID_EFFECT"
+    S4_SIN_DYNAMIC_STATEMENTS = "S4_SIN_DYNAMIC_STATEMENTS"
+    S4_ACCION_COMODIN = "S4_ACCION_COMODIN"
+    S4_PRINCIPAL_COMODIN = "S4_PRINCIPAL_COMODIN"
+
+    # REGLA S5: Logging y monitoreo
+    S5_SIN_ENABLE_LOGGING = "S5_SIN_ENABLE_LOGGING"
+    S5_SIN_ENABLE_VERSIONING = "S5_SIN_ENABLE_VERSIONING"
+    S5_S3_SIN_VERSIONING = "S5_S3_SIN_VERSIONING"
+    S5_S3_SIN_LOGGING = "S5_S3_SIN_LOGGING"
+    S5_CLOUDTRAIL_SIN_LOGGING = "S5_CLOUDTRAIL_SIN_LOGGING"
+    S5_LOG_GROUP_SIN_RETENCION = "S5_LOG_GROUP_SIN_RETENCION"
+
+    # REGLA S6: Configuración de redes
+    S6_VPC_SIN_DNS_HOSTNAMES = "S6_VPC_SIN_DNS_HOSTNAMES"
+    S6_VPC_SIN_DNS_SUPPORT = "S6_VPC_SIN_DNS_SUPPORT"
+    S6_SUBNET_IP_PUBLICA = "S6_SUBNET_IP_PUBLICA"
+    S6_NACL_PERMISIVA = "S6_NACL_PERMISIVA"
+
+
+# Plantillas de texto por código (str.format posicional con los argumentos del mensaje)
+_PLANTILLAS: Dict[CodigoMensaje, str] = {
+    CodigoMensaje.B1_ARCHIVO_FALTANTE: "❌ Archivo obligatorio faltante: {}",
+    CodigoMensaje.B1_ARCHIVO_SAMPLE_FALTANTE: "❌ Archivo sample obligatorio faltante: sample/{}",
+    CodigoMensaje.B1_DIRECTORIO_SAMPLE_FALTANTE: "❌ Directorio sample/ obligatorio faltante",
+    CodigoMensaje.B1_ESTRUCTURA_INCORRECTA: "❌ Estructura incorrecta: encontrados {} elementos, requeridos {}",
+    CodigoMensaje.B2_SIN_RESOURCE_NAMES: "❌ locals.tf debe contener 'resource_names' con convención de nomenclatura",
+    CodigoMensaje.B2_NOMENCLATURA_NO_IMPLEMENTADA: "❌ Convención de nomenclatura no implementada: {{client}}-{{project}}-{{environment}}-{{type}}-{{key}}",
+    CodigoMensaje.B2_MAIN_SIN_RESOURCE_NAMES: "⚠️ main.tf no usa local.resource_names para nombres de recursos",
+    CodigoMensaje.B3_VARIABLE_SIN_DESCRIPTION: "❌ Variable '{}' sin description obligatorio",
+    CodigoMensaje.B3_ENVIRONMENT_SIN_VALIDACION: "❌ Variable 'environment' debe tener validación con valores permitidos",
+    CodigoMensaje.B3_VARIABLE_FALTANTE: "❌ Variable obligatoria faltante: {}",
+    CodigoMensaje.B4_DEFAULT_TAGS_EN_MODULO: "⚠️ default_tags debe estar en el provider del consumidor, no en el módulo",
+    CodigoMensaje.B4_SIN_MERGE: "❌ Recursos deben usar merge() para combinar tags",
+    CodigoMensaje.B4_SIN_NAME: "❌ Recursos deben incluir tag 'Name' con convención de nomenclatura",
+    CodigoMensaje.B4_SIN_ADDITIONAL_TAGS: "⚠️ Considerar agregar soporte para additional_tags específicos por recurso",
+    CodigoMensaje.B5_TFVARS_FALTA_VARIABLE: "❌ terraform.tfvars.sample falta variable: {}",
+    CodigoMensaje.B5_TFVARS_PLACEHOLDERS: "⚠️ terraform.tfvars.sample contiene placeholders, debe tener valores reales",
+    CodigoMensaje.B5_TFVARS_ERROR_LECTURA: "❌ Error leyendo terraform.tfvars.sample: {}",
+    CodigoMensaje.B5_TFVARS_FALTANTE: "❌ terraform.tfvars.sample faltante",
+    CodigoMensaje.B5_README_FALTANTE: "❌ sample/README.md faltante",
+    CodigoMensaje.A1_MAP_OBJECT: "❌ Variable '{}' debe usar map(object()) para recursos múltiples",
+    CodigoMensaje.A1_LIST_OBJECT: "⚠️ Variable '{}' podría necesitar list(object()) para configuraciones múltiples",
+    CodigoMensaje.A1_MAP_STRING_TAGS: "⚠️ Variable '{}' debería usar map(string) para tags",
+    CodigoMensaje.A2_COUNT_PROHIBIDO: "❌ Uso de 'count' prohibido, debe usar 'for_each' para recursos múltiples",
+    CodigoMensaje.A2_RECURSO_SIN_FOR_EACH: "⚠️ Recurso podría necesitar for_each: {}.{}",
+    CodigoMensaje.A3_VARIABLE_SIN_VALIDACION: "❌ Variable crítica '{}' debe tener validación",
+    CodigoMensaje.A3_ENVIRONMENT_SIN_CONTAINS: "❌ Variable 'environment' debe validar valores permitidos con contains()",
+    CodigoMensaje.A3_SIN_REGEX: "⚠️ Variable '{}' debería validar formato con regex()",
+    CodigoMensaje.A4_SIN_PROVIDER_AWS: "❌ Provider AWS no configurado",
+    CodigoMensaje.A4_SIN_REQUIRED_VERSION: "⚠️ required_version no especificada",
+    CodigoMensaje.A4_VERSION_TERRAFORM: "⚠️ Versión mínima de Terraform debería ser >= 1.0",
+    CodigoMensaje.A4_SIN_REQUIRED_PROVIDERS: "⚠️ required_providers no especificado",
+    CodigoMensaje.A4_VERSION_AWS: "⚠️ AWS provider debería ser >= 5.0",
+    CodigoMensaje.A5_OUTPUT_SIN_DESCRIPTION: "❌ Output sin description: {}",
+    CodigoMensaje.A5_OUTPUT_SIN_FOR_EACH: "⚠️ Output podría necesitar for_each para recursos múltiples: {}",
+    CodigoMensaje.A7_FLATTEN_COMPLEJO: "❌ Transformación compleja con flatten() y for anidados prohibida",
+    CodigoMensaje.A7_DEMASIADO_COMPLEJA: "⚠️ Transformación en locals podría ser demasiado compleja (>2 niveles)",
+    CodigoMensaje.A7_SIN_RESOURCE_NAMES: "❌ locals.tf debe contener 'resource_names' con transformación simple",
+    CodigoMensaje.D1_SECCION_FALTANTE: "❌ Sección obligatoria faltante en README.md: {}",
+    CodigoMensaje.D1_ORDEN_SECCIONES: "❌ Las secciones del README.md no están en el orden correcto",
+    CodigoMensaje.D1_ELEMENTO_FALTANTE: "❌ Elemento obligatorio faltante: {}",
+    CodigoMensaje.D1_SIN_EJEMPLO_BASICO: "❌ README debe incluir 'Ejemplo Básico'",
+    CodigoMensaje.D1_SIN_EJEMPLO_AVANZADO: "❌ README debe incluir 'Ejemplo Avanzado'",
+    CodigoMensaje.D2_ELEMENTO_FALTANTE: "❌ Elemento obligatorio faltante en CHANGELOG.md: {}",
+    CodigoMensaje.D2_SIN_VERSIONES: "❌ No se encontraron versiones con formato correcto [X.Y.Z] - YYYY-MM-DD",
+    CodigoMensaje.D2_SECCIONES_NA: "⚠️ Algunas secciones contienen 'N/A', considerar agregar contenido específico",
+    CodigoMensaje.D3_ELEMENTO_FALTANTE: "❌ Elemento obligatorio faltante en sample/README.md: {}",
+    CodigoMensaje.D3_SIN_COMANDO: "❌ sample/README.md debe incluir comando: {}",
+    CodigoMensaje.D3_SIN_TFVARS: "❌ sample/README.md debe mencionar terraform.tfvars.sample",
+    CodigoMensaje.D4_TFDOCS_FALTANTE: "❌ Archivo .terraform-docs.yml faltante",
+    CodigoMensaje.D4_TFDOCS_ERROR_LECTURA: "❌ Error leyendo .terraform-docs.yml: {}",
+    CodigoMensaje.D4_TFDOCS_CLAVE_FALTANTE: "❌ Configuración terraform-docs faltante: {}",
+    CodigoMensaje.D4_TFDOCS_SIN_MARCADORES: "❌ Template debe incluir marcadores BEGIN_TF_DOCS/END_TF_DOCS",
+    CodigoMensaje.D4_VARIABLE_SIN_DESCRIPTION: "❌ Variable '{}' sin description obligatorio",
+    CodigoMensaje.D4_OUTPUT_SIN_DESCRIPTION: "❌ Output '{}' sin description obligatorio",
+    CodigoMensaje.D_LOTE_TIPO_NO_RECONOCIDO: "❌ Tipo de validación no reconocido: {}",
+    CodigoMensaje.D_LOTE_ERROR_EJECUCION: "Error ejecutando validación: {}",
+    CodigoMensaje.S1_SIN_ENCRYPTION_ENABLED: "❌ Variables deben incluir 'encryption_enabled' con default true",
+    CodigoMensaje.S1_ENCRYPTION_DEFAULT_FALSE: "❌ 'encryption_enabled' debe tener default = true",
+    CodigoMensaje.S1_S3_SIN_CIFRADO: "❌ Buckets S3 deben tener configuración de cifrado server-side",
+    CodigoMensaje.S1_RDS_SIN_CIFRADO: "❌ Instancias RDS deben tener storage_encrypted = true",
+    CodigoMensaje.S1_KMS_SIN_ROTACION: "⚠️ KMS keys deberían tener key rotation habilitado",
+    CodigoMensaje.S2_SIN_BLOCK_PUBLIC_ACCESS: "❌ Variables deben incluir 'block_public_access' con default true",
+    CodigoMensaje.S2_S3_SIN_PUBLIC_ACCESS_BLOCK: "❌ Buckets S3 deben tener aws_s3_bucket_public_access_block",
+    CodigoMensaje.S2_CONFIGURACION_PUBLICA: "⚠️ Configuración pública detectada, verificar que sea intencional",
+    CodigoMensaje.S2_SECURITY_GROUP_ABIERTO: "⚠️ Security group con acceso desde 0.0.0.0/0 detectado",
+    CodigoMensaje.S3_S3_SIN_FORCE_SSL: "❌ Buckets S3 deben tener política para forzar SSL/TLS",
+    CodigoMensaje.S3_HTTP_INSEGURO: "❌ URLs HTTP inseguras detectadas, usar HTTPS",
+    CodigoMensaje.S3_SSL_DESHABILITADO: "❌ SSL/TLS deshabilitado detectado",
+    CodigoMensaje.S3_LB_SIN_HTTPS: "⚠️ Load Balancer debería usar HTTPS/SSL",
+    CodigoMensaje.S4_SIN_POLICY_STATEMENTS: "⚠️ Considerar agregar 'policy_statements' para políticas personalizadas",
+    CodigoMensaje.S4_STATEMENT_SIN_SID_EFFECT: "❌ policy_statements debe incluir 'sid' y 'effect'",
+    CodigoMensaje.S4_SIN_DYNAMIC_STATEMENTS: "⚠️ Considerar usar dynamic statements para políticas flexibles",
+    CodigoMensaje.S4_ACCION_COMODIN: "⚠️ Política con acciones '*' detectada, verificar que sea necesaria",
+    CodigoMensaje.S4_PRINCIPAL_COMODIN: "⚠️ Política con Principal '*' detectada, considerar ser más restrictivo",
+    CodigoMensaje.S5_SIN_ENABLE_LOGGING: "⚠️ Considerar agregar 'enable_logging' para auditoría",
+    CodigoMensaje.S5_SIN_ENABLE_VERSIONING: "⚠️ Considerar agregar 'enable_versioning' para auditoría",
+    CodigoMensaje.S5_S3_SIN_VERSIONING: "⚠️ Buckets S3 deberían tener versioning habilitado",
+    CodigoMensaje.S5_S3_SIN_LOGGING: "⚠️ Buckets S3 deberían tener access logging habilitado",
+    CodigoMensaje.S5_CLOUDTRAIL_SIN_LOGGING: "❌ CloudTrail debe tener logging habilitado",
+    CodigoMensaje.S5_LOG_GROUP_SIN_RETENCION: "⚠️ CloudWatch log groups deberían tener retention configurado",
+    CodigoMensaje.S6_VPC_SIN_DNS_HOSTNAMES: "⚠️ VPC debería tener DNS hostnames habilitado",
+    CodigoMensaje.S6_VPC_SIN_DNS_SUPPORT: "⚠️ VPC debería tener DNS support habilitado",
+    CodigoMensaje.S6_SUBNET_IP_PUBLICA: "⚠️ Subnets no deberían asignar IPs públicas automáticamente",
+    CodigoMensaje.S6_NACL_PERMISIVA: "⚠️ Network ACL con reglas muy permisivas detectado",
+}
+
+
+class Mensaje(NamedTuple):
+    """Error o advertencia estructurado: código + argumentos, texto bajo demanda"""
+
+    codigo: CodigoMensaje
+    args: Tuple[Any, ...] = ()
+
+    def __str__(self) -> str:
+        return _PLANTILLAS[self.codigo].format(*self.args)
+
+
+def mensaje(codigo: CodigoMensaje, *args: Any) -> Mensaje:
+    """Atajo para construir un Mensaje con argumentos posicionales"""
+    return Mensaje(codigo, args)
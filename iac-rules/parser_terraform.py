@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Parser ligero de archivos Terraform
+Extrae en una sola pasada lineal los bloques variable/resource/output/locals
+(respetando llaves anidadas, cadenas y comentarios) para que todas las reglas
+consuman la misma estructura ya procesada
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Cabecera de bloque de primer nivel: `tipo "etiqueta" "etiqueta" {`
+_RE_CABECERA = re.compile(r'(?m)^[ \t]*([A-Za-z_][\w-]*)((?:[ \t]+"[^"\n]*")*)[ \t]*\{')
+# Cabecera en la columna 0: donde termina un bloque al que le falta la llave de cierre
+_RE_CABECERA_COLUMNA_0 = re.compile(r'(?m)^([A-Za-z_][\w-]*)((?:[ \t]+"[^"\n]*")*)[ \t]*\{')
+_RE_ETIQUETA = re.compile(r'"([^"\n]*)"')
+# Caracteres que pueden alterar la profundidad de llaves o abrir cadenas/comentarios/heredocs
+_RE_ESPECIAL = re.compile(r'["{}#]|//|/\*|<<-?[ \t]*([A-Za-z_]\w*)\n')
+_RE_ESPECIAL_CADENA = re.compile(r'\\.|"|[$%]\{', re.DOTALL)
+_RE_ATRIBUTO_TYPE = re.compile(r'(?m)^[ \t]*type[ \t]*=(?!=)[ \t]*')
+_TIPOS_BLOQUE = frozenset({"variable", "resource", "output", "locals"})
+
+_APERTURAS = "([{"
+_CIERRES = ")]}"
+
+
+@dataclass(frozen=True)
+class BloqueTerraform:
+    """Bloque Terraform extraído: cabecera, cuerpo y posición en el archivo"""
+    tipo_bloque: str
+    nombre: str
+    cuerpo: str
+    inicio: int
+    fin: int
+    tipo_recurso: Optional[str] = None
+    tipo: Optional[str] = None
+    cerrado: bool = True  # False si el archivo termina antes de la llave de cierre
+
+    def define_atributo(self, atributo: str) -> bool:
+        """Indica si el cuerpo asigna el atributo (`atributo = ...`)"""
+        return atributo in self.cuerpo and _compilar_atributo(atributo).search(self.cuerpo) is not None
+
+    def contiene_bloque(self, bloque: str) -> bool:
+        """Indica si el cuerpo contiene un sub-bloque (`bloque { ... }`)"""
+        return bloque in self.cuerpo and _compilar_sub_bloque(bloque).search(self.cuerpo) is not None
+
+
+@dataclass(frozen=True)
+class ArchivoTerraform:
+    """Resultado del parseo de un archivo Terraform"""
+    variables: Tuple[BloqueTerraform, ...] = ()
+    recursos: Tuple[BloqueTerraform, ...] = ()
+    outputs: Tuple[BloqueTerraform, ...] = ()
+    bloques_locals: Tuple[BloqueTerraform, ...] = ()
+
+    @cached_property
+    def variables_por_nombre(self) -> Dict[str, BloqueTerraform]:
+        """Índice de variables por nombre (gana la primera declaración)"""
+        indice: Dict[str, BloqueTerraform] = {}
+        for variable in self.variables:
+            indice.setdefault(variable.nombre, variable)
+        return indice
+
+
+@lru_cache(maxsize=32)
+def _compilar_atributo(atributo: str) -> "re.Pattern[str]":
+    return re.compile(rf'\b{re.escape(atributo)}\s*=')
+
+
+@lru_cache(maxsize=32)
+def _compilar_sub_bloque(bloque: str) -> "re.Pattern[str]":
+    return re.compile(rf'\b{re.escape(bloque)}\s*\{{')
+
+
+@lru_cache(maxsize=32)
+def _compilar_fin_heredoc(delimitador: str) -> "re.Pattern[str]":
+    return re.compile(rf'(?m)^[ \t]*{delimitador}[ \t]*$')
+
+
+def _extraer_expresion(texto: str, inicio: int) -> str:
+    """Extraer una expresión HCL desde `inicio` hasta el fin de línea con paréntesis balanceados"""
+    profundidad = 0
+    for posicion in range(inicio, len(texto)):
+        caracter = texto[posicion]
+        if caracter in _APERTURAS:
+            profundidad += 1
+        elif caracter in _CIERRES:
+            profundidad -= 1
+        elif caracter == "\n" and profundidad <= 0:
+            return texto[inicio:posicion].strip()
+    return texto[inicio:].strip()
+
+
+def _fin_cadena(texto: str, posicion: int) -> int:
+    """Posición siguiente a la comilla que cierra la cadena iniciada antes de `posicion`"""
+    while True:
+        match = _RE_ESPECIAL_CADENA.search(texto, posicion)
+        if match is None:
+            return len(texto)
+        token = match.group()
+        if token == '"':
+            return match.end()
+        if token[0] in "$%":
+            # Interpolación `${ ... }`: puede contener cadenas y llaves anidadas
+            posicion = _cierre_llave(texto, match.end()) + 1
+        else:
+            posicion = match.end()
+
+
+def _cierre_llave(texto: str, posicion: int) -> int:
+    """Índice de la llave que cierra el bloque abierto justo antes de `posicion`
+
+    Recorre el texto una sola vez contando profundidad y saltando cadenas,
+    comentarios y heredocs, de modo que las llaves que aparecen dentro de ellos
+    no alteran el balance. Si el bloque no se cierra devuelve len(texto).
+    """
+    profundidad = 1
+    longitud = len(texto)
+    while posicion < longitud:
+        match = _RE_ESPECIAL.search(texto, posicion)
+        if match is None:
+            return longitud
+        token = match.group()
+        if token == "{":
+            profundidad += 1
+            posicion = match.end()
+        elif token == "}":
+            profundidad -= 1
+            if profundidad == 0:
+                return match.start()
+            posicion = match.end()
+        elif token == '"':
+            posicion = _fin_cadena(texto, match.end())
+        elif token == "/*":
+            fin = texto.find("*/", match.end())
+            posicion = longitud if fin == -1 else fin + 2
+        elif token[0] == "<":
+            fin = _compilar_fin_heredoc(match.group(1)).search(texto, match.end())
+            posicion = longitud if fin is None else fin.end()
+        else:
+            # Comentario de línea (`#` o `//`)
+            fin = texto.find("\n", match.end())
+            posicion = longitud if fin == -1 else fin + 1
+    return longitud
+
+
+def iterar_bloques(texto: str) -> Iterator[Tuple[str, Tuple[str, ...], str, int, int, bool]]:
+    """Recorrer los bloques de primer nivel: (tipo, etiquetas, cuerpo, inicio, fin, cerrado)
+
+    Búsqueda lineal: cada cabecera se localiza con un patrón y su cuerpo se
+    delimita contando llaves, por lo que los bloques anidados (validation,
+    dynamic, lifecycle...) quedan completos dentro del cuerpo del bloque padre.
+    """
+    posicion = 0
+    while True:
+        match = _RE_CABECERA.search(texto, posicion)
+        if match is None:
+            return
+        cierre = _cierre_llave(texto, match.end())
+        etiquetas = tuple(_RE_ETIQUETA.findall(match.group(2)))
+        cerrado = cierre < len(texto)
+        if cerrado:
+            fin = cierre + 1
+        else:
+            # Sin llave de cierre: el bloque llega hasta la siguiente cabecera de primer
+            # nivel (columna 0) y el recorrido continúa desde ella
+            siguiente = _RE_CABECERA_COLUMNA_0.search(texto, match.end())
+            cierre = fin = len(texto) if siguiente is None else siguiente.start()
+        yield match.group(1), etiquetas, texto[match.end():cierre], match.start(), fin, cerrado
+        posicion = fin
+
+
+def _extraer_tipo(cuerpo: str) -> Optional[str]:
+    """Obtener la expresión del atributo `type` de una variable, si existe"""
+    match = _RE_ATRIBUTO_TYPE.search(cuerpo) if "type" in cuerpo else None
+    if not match:
+        return None
+    return _extraer_expresion(cuerpo, match.end())
+
+
+@lru_cache(maxsize=64)
+def parsear_terraform(contenido: str) -> ArchivoTerraform:
+    """Parsear un archivo Terraform una sola vez (resultado cacheado por contenido)"""
+    bloques: Dict[str, List[BloqueTerraform]] = {tipo: [] for tipo in _TIPOS_BLOQUE}
+    for tipo_bloque, etiquetas, cuerpo, inicio, fin, cerrado in iterar_bloques(contenido):
+        if tipo_bloque not in _TIPOS_BLOQUE:
+            continue
+        if tipo_bloque == "resource":
+            if len(etiquetas) < 2:
+                continue
+            bloque = BloqueTerraform(tipo_bloque, etiquetas[1], cuerpo, inicio, fin, tipo_recurso=etiquetas[0], cerrado=cerrado)
+        elif tipo_bloque == "locals":
+            bloque = BloqueTerraform(tipo_bloque, "locals", cuerpo, inicio, fin, cerrado=cerrado)
+        elif not etiquetas:
+            continue
+        elif tipo_bloque == "variable":
+            bloque = BloqueTerraform(tipo_bloque, etiquetas[0], cuerpo, inicio, fin, tipo=_extraer_tipo(cuerpo), cerrado=cerrado)
+        else:
+            bloque = BloqueTerraform(tipo_bloque, etiquetas[0], cuerpo, inicio, fin, cerrado=cerrado)
+        bloques[tipo_bloque].append(bloque)
+    return ArchivoTerraform(
+        tuple(bloques["variable"]),
+        tuple(bloques["resource"]),
+        tuple(bloques["output"]),
+        tuple(bloques["locals"]),
+    )
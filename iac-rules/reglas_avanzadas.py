@@ -5,12 +5,33 @@ Implementa técnicas avanzadas de Terraform según Pragma CloudOps
 """
 
 import re
-from typing import Dict, Any, List
+from typing import List
+
+from .cache_resultados import memoizar_por_contenido
+from .caracteristicas_locals import extraer_caracteristicas_locals
+from .escaneo_literales import EscanerLiterales
+from .mensajes import CodigoMensaje, Mensaje, mensaje
+from .parser_terraform import parsear_terraform
+from .resultados import ResultadoValidacion, construir_resultado
+
+# Patrones precompilados (se compilan una sola vez al importar el módulo)
+_RE_COUNT = re.compile(r'\bcount\s*=')
+_RE_FLATTEN_COMPLEJO = re.compile(r'flatten\(\s*\[\s*for[^]]*for[^]]*\]\s*\)', re.DOTALL)
+_RE_FOR = re.compile(r'for\s+[^}]*\{')
+
+# Literales de providers.tf que consume la regla A4 (una sola pasada por archivo)
+_ESCANER_PROVIDERS = EscanerLiterales((
+    'provider "aws"', "terraform {", "required_version", ">= 1.0",
+    "required_providers", "aws", ">= 5.0"
+))
+
 
 class ReglasAvanzadas:
     """Implementa las reglas avanzadas A1-A7 para módulos Terraform"""
     
-    def __init__(self):
+    __slots__ = ("tipos_datos_permitidos",)
+    
+    def __init__(self) -> None:
         # REGLA A1: Tipos de datos inteligentes
         self.tipos_datos_permitidos = {
             "multiples_recursos": "map(object())",
@@ -19,192 +40,175 @@ class ReglasAvanzadas:
             "arrays_simples": "list(string)"
         }
 
-    def validar_tipos_datos_inteligentes(self, contenido_variables: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_tipos_datos_inteligentes(self, contenido_variables: str) -> ResultadoValidacion:
         """REGLA A1: Validar uso correcto de tipos de datos inteligentes"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
         
         # Buscar definiciones de variables con tipos complejos
-        patron_variables = r'variable\s+"([^"]+)"\s*\{[^}]*type\s*=\s*([^}]+)\}'
-        variables_tipos = re.findall(patron_variables, contenido_variables, re.DOTALL)
+        variables_tipos = [
+            (variable.nombre, variable.tipo)
+            for variable in parsear_terraform(contenido_variables).variables
+            if variable.tipo is not None and variable.cerrado
+        ]
         
         for nombre_var, tipo in variables_tipos:
-            tipo_limpio = re.sub(r'\s+', ' ', tipo.strip())
+            tipo_limpio = ' '.join(tipo.split())
             
             # Verificar uso correcto de map(object()) para recursos múltiples
             if "_config" in nombre_var and "map(object(" not in tipo_limpio:
-                errores.append(f"❌ Variable '{nombre_var}' debe usar map(object()) para recursos múltiples")
+                errores.append(mensaje(CodigoMensaje.A1_MAP_OBJECT, nombre_var))
             
             # Verificar uso correcto de list(object()) para configuraciones anidadas
             if "rules" in nombre_var and "list(object(" not in tipo_limpio:
-                advertencias.append(f"⚠️ Variable '{nombre_var}' podría necesitar list(object()) para configuraciones múltiples")
+                advertencias.append(mensaje(CodigoMensaje.A1_LIST_OBJECT, nombre_var))
             
             # Verificar uso correcto de map(string) para tags
             if "tags" in nombre_var and tipo_limpio != "map(string)":
-                advertencias.append(f"⚠️ Variable '{nombre_var}' debería usar map(string) para tags")
+                advertencias.append(mensaje(CodigoMensaje.A1_MAP_STRING_TAGS, nombre_var))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "variables_analizadas": len(variables_tipos)
-        }
+        return construir_resultado(
+            errores,
+            advertencias,
+            variables_analizadas=len(variables_tipos)
+        )
 
-    def validar_for_each_obligatorio(self, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_for_each_obligatorio(self, contenido_main: str) -> ResultadoValidacion:
         """REGLA A2: Validar uso obligatorio de for_each (nunca count)"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
         
         # Buscar uso de count (prohibido)
-        if re.search(r'\bcount\s*=', contenido_main):
-            errores.append("❌ Uso de 'count' prohibido, debe usar 'for_each' para recursos múltiples")
+        if "count" in contenido_main and _RE_COUNT.search(contenido_main):
+            errores.append(mensaje(CodigoMensaje.A2_COUNT_PROHIBIDO))
         
         # Buscar recursos que deberían usar for_each
-        patron_recursos = r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{'
-        recursos = re.findall(patron_recursos, contenido_main)
-        
-        recursos_sin_for_each = []
-        for tipo_recurso, nombre_recurso in recursos:
-            # Buscar el bloque completo del recurso
-            patron_bloque = rf'resource\s+"{tipo_recurso}"\s+"{nombre_recurso}"\s*\{{[^}}]*\}}'
-            bloque = re.search(patron_bloque, contenido_main, re.DOTALL)
-            
-            if bloque and "for_each" not in bloque.group():
-                # Si el recurso no tiene for_each, podría necesitarlo
-                if "var." in bloque.group() and "_config" in bloque.group():
-                    recursos_sin_for_each.append(f"{tipo_recurso}.{nombre_recurso}")
-        
-        if recursos_sin_for_each:
-            advertencias.extend([f"⚠️ Recurso podría necesitar for_each: {recurso}" for recurso in recursos_sin_for_each])
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "recursos_analizados": len(recursos)
-        }
+        recursos = parsear_terraform(contenido_main).recursos
+        
+        # Si el recurso no tiene for_each pero consume una variable *_config, podría necesitarlo
+        advertencias.extend(
+            mensaje(CodigoMensaje.A2_RECURSO_SIN_FOR_EACH, recurso.tipo_recurso, recurso.nombre)
+            for recurso in recursos
+            if recurso.cerrado
+            and "for_each" not in recurso.cuerpo and "var." in recurso.cuerpo and "_config" in recurso.cuerpo
+        )
+        
+        return construir_resultado(
+            errores,
+            advertencias,
+            recursos_analizados=len(recursos)
+        )
 
-    def validar_validaciones_variables(self, contenido_variables: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_validaciones_variables(self, contenido_variables: str) -> ResultadoValidacion:
         """REGLA A3: Validar que variables críticas tengan validaciones"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
         
         # Variables que DEBEN tener validación
         variables_criticas = ["environment", "client", "project"]
+        variables_por_nombre = parsear_terraform(contenido_variables).variables_por_nombre
         
         for variable in variables_criticas:
-            patron_variable = rf'variable\s+"{variable}"\s*\{{([^}}]*)\}}'
-            match = re.search(patron_variable, contenido_variables, re.DOTALL)
+            bloque = variables_por_nombre.get(variable)
             
-            if match:
-                contenido_variable = match.group(1)
+            # Un bloque sin llave de cierre (archivo truncado) no se puede evaluar
+            if bloque and bloque.cerrado:
+                contenido_variable = bloque.cuerpo
                 if "validation" not in contenido_variable:
-                    errores.append(f"❌ Variable crítica '{variable}' debe tener validación")
+                    errores.append(mensaje(CodigoMensaje.A3_VARIABLE_SIN_VALIDACION, variable))
                 else:
                     # Verificar tipos específicos de validación
                     if variable == "environment" and "contains(" not in contenido_variable:
-                        errores.append("❌ Variable 'environment' debe validar valores permitidos con contains()")
+                        errores.append(mensaje(CodigoMensaje.A3_ENVIRONMENT_SIN_CONTAINS))
                     
                     if variable in ["client", "project"] and "regex(" not in contenido_variable:
-                        advertencias.append(f"⚠️ Variable '{variable}' debería validar formato con regex()")
+                        advertencias.append(mensaje(CodigoMensaje.A3_SIN_REGEX, variable))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_transformaciones_simples_locals(self, contenido_locals: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_transformaciones_simples_locals(self, contenido_locals: str) -> ResultadoValidacion:
         """REGLA A7: Validar que transformaciones en locals sean simples (máximo 2 niveles)"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        caracteristicas = extraer_caracteristicas_locals(contenido_locals)
         
         # Buscar uso de flatten() con for complejos (prohibido)
-        if "flatten(" in contenido_locals and "for" in contenido_locals:
+        if caracteristicas.tiene_flatten and caracteristicas.tiene_for:
             # Verificar si es un flatten complejo
-            patron_flatten_complejo = r'flatten\(\s*\[\s*for[^]]*for[^]]*\]\s*\)'
-            if re.search(patron_flatten_complejo, contenido_locals, re.DOTALL):
-                errores.append("❌ Transformación compleja con flatten() y for anidados prohibida")
+            if _RE_FLATTEN_COMPLEJO.search(contenido_locals):
+                errores.append(mensaje(CodigoMensaje.A7_FLATTEN_COMPLEJO))
         
         # Contar niveles de anidamiento en for expressions
-        patron_for = r'for\s+[^}]*\{'
-        for_expressions = re.findall(patron_for, contenido_locals)
+        for_expressions: List[str] = _RE_FOR.findall(contenido_locals) if caracteristicas.tiene_for else []
         
         for expr in for_expressions:
             # Contar llaves anidadas como indicador de complejidad
             nivel_anidamiento = expr.count('{') + expr.count('[')
             if nivel_anidamiento > 2:
-                advertencias.append("⚠️ Transformación en locals podría ser demasiado compleja (>2 niveles)")
+                advertencias.append(mensaje(CodigoMensaje.A7_DEMASIADO_COMPLEJA))
         
         # Verificar que exista resource_names (obligatorio)
-        if "resource_names" not in contenido_locals:
-            errores.append("❌ locals.tf debe contener 'resource_names' con transformación simple")
+        if not caracteristicas.tiene_resource_names:
+            errores.append(mensaje(CodigoMensaje.A7_SIN_RESOURCE_NAMES))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_outputs_descriptivos(self, contenido_outputs: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_outputs_descriptivos(self, contenido_outputs: str) -> ResultadoValidacion:
         """REGLA A5: Validar que outputs tengan descriptions y estructura correcta"""
-        errores = []
-        advertencias = []
-        
-        # Buscar todos los outputs
-        patron_outputs = r'output\s+"([^"]+)"\s*\{([^}]*)\}'
-        outputs = re.findall(patron_outputs, contenido_outputs, re.DOTALL)
-        
-        outputs_sin_description = []
-        outputs_sin_for_each = []
-        
-        for nombre_output, contenido_output in outputs:
-            # Verificar description obligatorio
-            if "description" not in contenido_output:
-                outputs_sin_description.append(nombre_output)
-            
-            # Verificar uso de for_each en outputs para recursos múltiples
-            if "value" in contenido_output and "aws_" in contenido_output:
-                if "for k, v in" not in contenido_output and "[" not in contenido_output:
-                    outputs_sin_for_each.append(nombre_output)
-        
-        if outputs_sin_description:
-            errores.extend([f"❌ Output sin description: {output}" for output in outputs_sin_description])
-        
-        if outputs_sin_for_each:
-            advertencias.extend([f"⚠️ Output podría necesitar for_each para recursos múltiples: {output}" for output in outputs_sin_for_each])
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "outputs_analizados": len(outputs)
-        }
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        
+        # Buscar todos los outputs (completos: los que no cierran no se evalúan)
+        outputs = [output for output in parsear_terraform(contenido_outputs).outputs if output.cerrado]
+        
+        # Verificar description obligatorio
+        errores.extend(
+            mensaje(CodigoMensaje.A5_OUTPUT_SIN_DESCRIPTION, output.nombre)
+            for output in outputs
+            if "description" not in output.cuerpo
+        )
+        
+        # Verificar uso de for_each en outputs para recursos múltiples
+        advertencias.extend(
+            mensaje(CodigoMensaje.A5_OUTPUT_SIN_FOR_EACH, output.nombre)
+            for output in outputs
+            if "value" in output.cuerpo and "aws_" in output.cuerpo
+            and "for k, v in" not in output.cuerpo and "[" not in output.cuerpo
+        )
+        
+        return construir_resultado(
+            errores,
+            advertencias,
+            outputs_analizados=len(outputs)
+        )
 
-    def validar_provider_configuracion(self, contenido_providers: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_provider_configuracion(self, contenido_providers: str) -> ResultadoValidacion:
         """REGLA A4: Validar configuración obligatoria del provider"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        presentes = _ESCANER_PROVIDERS.presentes(contenido_providers)
         
         # Verificar provider AWS
-        if 'provider "aws"' not in contenido_providers:
-            errores.append("❌ Provider AWS no configurado")
+        if 'provider "aws"' not in presentes:
+            errores.append(mensaje(CodigoMensaje.A4_SIN_PROVIDER_AWS))
         
         # Verificar versión mínima de Terraform
-        if "terraform {" in contenido_providers:
-            if "required_version" not in contenido_providers:
-                advertencias.append("⚠️ required_version no especificada")
-            elif ">= 1.0" not in contenido_providers:
-                advertencias.append("⚠️ Versión mínima de Terraform debería ser >= 1.0")
+        if "terraform {" in presentes:
+            if "required_version" not in presentes:
+                advertencias.append(mensaje(CodigoMensaje.A4_SIN_REQUIRED_VERSION))
+            elif ">= 1.0" not in presentes:
+                advertencias.append(mensaje(CodigoMensaje.A4_VERSION_TERRAFORM))
         
         # Verificar required_providers
-        if "required_providers" not in contenido_providers:
-            advertencias.append("⚠️ required_providers no especificado")
-        elif "aws" not in contenido_providers or ">= 5.0" not in contenido_providers:
-            advertencias.append("⚠️ AWS provider debería ser >= 5.0")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        if "required_providers" not in presentes:
+            advertencias.append(mensaje(CodigoMensaje.A4_SIN_REQUIRED_PROVIDERS))
+        elif "aws" not in presentes or ">= 5.0" not in presentes:
+            advertencias.append(mensaje(CodigoMensaje.A4_VERSION_AWS))
+        
+        return construir_resultado(errores, advertencias)
@@ -4,193 +4,241 @@ Reglas Básicas de IaC (B1-B5)
 Implementa las reglas fundamentales para módulos Terraform según Pragma CloudOps
 """
 
-import re
 import os
-from typing import Dict, Any, List
+from typing import Dict, Iterable, List, Set
+
+from .cache_resultados import memoizar_por_contenido
+from .caracteristicas_locals import extraer_caracteristicas_locals
+from .escaneo_literales import EscanerLiterales
+from .mensajes import CodigoMensaje, Mensaje, mensaje
+from .parser_terraform import parsear_terraform
+from .resultados import ResultadoValidacion, construir_resultado
+
+# REGLA B1: Estructura obligatoria
+_ARCHIVOS_RAIZ = frozenset({
+    ".gitignore", "CHANGELOG.md", "README.md", "data.tf",
+    "locals.tf", "main.tf", "outputs.tf", "providers.tf", "variables.tf"
+})
+
+# Relativos a sample/
+_ARCHIVOS_SAMPLE = frozenset({
+    "README.md", "data.tf", "main.tf",
+    "outputs.tf", "providers.tf", "terraform.tfvars.sample"
+})
+
+_TOTAL_ELEMENTOS_OBLIGATORIOS = 16  # 9 archivos raíz + 1 directorio + 6 archivos sample
+
+# Un bit por elemento obligatorio: bits 0-8 archivos raíz, bit 9 sample/, bits 10-15 archivos sample
+# (en orden alfabético dentro de cada grupo, que es el orden de los mensajes)
+_BITS_RAIZ = tuple((1 << bit, archivo) for bit, archivo in enumerate(sorted(_ARCHIVOS_RAIZ)))
+_BIT_DIRECTORIO_SAMPLE = 1 << len(_BITS_RAIZ)
+_BITS_SAMPLE = tuple((_BIT_DIRECTORIO_SAMPLE << (bit + 1), archivo) for bit, archivo in enumerate(sorted(_ARCHIVOS_SAMPLE)))
+_MASCARA_COMPLETA = (1 << _TOTAL_ELEMENTOS_OBLIGATORIOS) - 1
+
+# REGLA B3: Variables obligatorias (tupla: el orden define el de los mensajes)
+_VARIABLES_OBLIGATORIAS = ("client", "project", "environment")
+_VARIABLES_OBLIGATORIAS_BYTES = tuple((variable, variable.encode()) for variable in _VARIABLES_OBLIGATORIAS)
+
+# REGLA B4: Etiquetas obligatorias
+_ETIQUETAS_TRANSVERSALES = frozenset({
+    "environment", "project", "owner", "client",
+    "area", "provisioned", "datatype"
+})
+
+# Literales de main.tf que consume la regla B4 (una sola pasada por archivo)
+_ESCANER_ETIQUETADO_MAIN = EscanerLiterales(("tags = merge(", '"Name"', "additional_tags"))
+
+
+def _entradas_directorio(ruta: str) -> Set[str]:
+    """Nombres presentes en un directorio con una sola lectura (vacío si no existe)"""
+    try:
+        with os.scandir(ruta) as entradas:
+            return {entrada.name for entrada in entradas}
+    except OSError:
+        return set()
+
 
 class ReglasBasicas:
     """Implementa las reglas básicas B1-B5 para módulos Terraform"""
     
-    def __init__(self):
-        # REGLA B1: Estructura obligatoria
-        self.archivos_obligatorios_raiz = [
-            ".gitignore", "CHANGELOG.md", "README.md", "data.tf", 
-            "locals.tf", "main.tf", "outputs.tf", "providers.tf", "variables.tf"
-        ]
-        
-        self.archivos_obligatorios_sample = [
-            "sample/README.md", "sample/data.tf", "sample/main.tf", 
-            "sample/outputs.tf", "sample/providers.tf", "sample/terraform.tfvars.sample"
-        ]
-        
-        self.total_elementos_obligatorios = 16  # 9 archivos raíz + 1 directorio + 6 archivos sample
-        
-        # REGLA B3: Variables obligatorias
-        self.variables_obligatorias = ["client", "project", "environment"]
-        
-        # REGLA B4: Etiquetas obligatorias
-        self.etiquetas_transversales = [
-            "environment", "project", "owner", "client", 
-            "area", "provisioned", "datatype"
-        ]
-
-    def validar_estructura_modulo_completa(self, ruta_modulo: str) -> Dict[str, Any]:
+    __slots__ = (
+        "archivos_obligatorios_raiz",
+        "archivos_obligatorios_sample",
+        "total_elementos_obligatorios",
+        "variables_obligatorias",
+        "etiquetas_transversales"
+    )
+    
+    def __init__(self) -> None:
+        # Constantes compartidas (inmutables) de las reglas B1-B4
+        self.archivos_obligatorios_raiz = _ARCHIVOS_RAIZ
+        self.archivos_obligatorios_sample = _ARCHIVOS_SAMPLE
+        self.total_elementos_obligatorios = _TOTAL_ELEMENTOS_OBLIGATORIOS
+        self.variables_obligatorias = _VARIABLES_OBLIGATORIAS
+        self.etiquetas_transversales = _ETIQUETAS_TRANSVERSALES
+
+    def validar_estructura_modulo_completa(self, ruta_modulo: str) -> ResultadoValidacion:
         """REGLA B1: Validar estructura completa de 16 elementos obligatorios"""
-        errores = []
-        advertencias = []
-        elementos_encontrados = 0
-        
-        # Verificar archivos en raíz
-        for archivo in self.archivos_obligatorios_raiz:
-            ruta_archivo = os.path.join(ruta_modulo, archivo)
-            if os.path.exists(ruta_archivo):
-                elementos_encontrados += 1
-            else:
-                errores.append(f"❌ Archivo obligatorio faltante: {archivo}")
-        
-        # Verificar directorio sample/
-        sample_dir = os.path.join(ruta_modulo, "sample")
-        if os.path.exists(sample_dir):
-            elementos_encontrados += 1  # Contar el directorio
-            
-            # Verificar archivos dentro de sample/
-            for archivo in self.archivos_obligatorios_sample:
-                ruta_archivo = os.path.join(ruta_modulo, archivo)
-                if os.path.exists(ruta_archivo):
-                    elementos_encontrados += 1
+        return self.validar_estructura_lote((ruta_modulo,))[ruta_modulo]
+
+    def validar_estructura_lote(self, raices: Iterable[str]) -> Dict[str, ResultadoValidacion]:
+        """REGLA B1 sobre varios módulos: un recorrido os.walk por módulo (raíz + sample/)"""
+        resultados: Dict[str, ResultadoValidacion] = {}
+        for raiz in raices:
+            entradas_raiz: Set[str] = set()
+            entradas_sample: Set[str] = set()
+            # followlinks=True para respetar un sample/ enlazado; el descenso se limita
+            # a raíz y sample/, así que no hay riesgo de ciclos
+            for ruta, directorios, archivos in os.walk(raiz, followlinks=True):
+                if ruta == raiz:
+                    entradas_raiz = set(directorios).union(archivos)
+                    directorios[:] = [directorio for directorio in directorios if directorio == "sample"]
                 else:
-                    errores.append(f"❌ Archivo sample obligatorio faltante: {archivo}")
-        else:
-            errores.append("❌ Directorio sample/ obligatorio faltante")
+                    entradas_sample = set(directorios).union(archivos)
+                    directorios.clear()
+            resultados[raiz] = self._evaluar_estructura(entradas_raiz, entradas_sample)
+        return resultados
+
+    def _evaluar_estructura(self, entradas_raiz: Set[str], entradas_sample: Set[str]) -> ResultadoValidacion:
+        """Comparar las entradas presentes contra los 16 elementos obligatorios"""
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        
+        # Marcar cada elemento presente con su bit
+        mascara = 0
+        for bit, archivo in _BITS_RAIZ:
+            if archivo in entradas_raiz:
+                mascara |= bit
+        if "sample" in entradas_raiz:
+            mascara |= _BIT_DIRECTORIO_SAMPLE
+            for bit, archivo in _BITS_SAMPLE:
+                if archivo in entradas_sample:
+                    mascara |= bit
         
-        # Validación numérica exacta
-        if elementos_encontrados != self.total_elementos_obligatorios:
-            errores.append(f"❌ Estructura incorrecta: encontrados {elementos_encontrados} elementos, requeridos {self.total_elementos_obligatorios}")
+        # Verificar archivos en raíz
+        errores.extend(mensaje(CodigoMensaje.B1_ARCHIVO_FALTANTE, archivo) for bit, archivo in _BITS_RAIZ if not mascara & bit)
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "elementos_encontrados": elementos_encontrados,
-            "elementos_requeridos": self.total_elementos_obligatorios
-        }
+        # Verificar directorio sample/ y los archivos dentro de él
+        if mascara & _BIT_DIRECTORIO_SAMPLE:
+            errores.extend(mensaje(CodigoMensaje.B1_ARCHIVO_SAMPLE_FALTANTE, archivo) for bit, archivo in _BITS_SAMPLE if not mascara & bit)
+        else:
+            errores.append(mensaje(CodigoMensaje.B1_DIRECTORIO_SAMPLE_FALTANTE))
+        
+        # Validación numérica exacta (popcount de la máscara)
+        elementos_encontrados = mascara.bit_count()
+        if mascara != _MASCARA_COMPLETA:
+            errores.append(mensaje(CodigoMensaje.B1_ESTRUCTURA_INCORRECTA, elementos_encontrados, _TOTAL_ELEMENTOS_OBLIGATORIOS))
+        
+        return construir_resultado(
+            errores,
+            advertencias,
+            elementos_encontrados=elementos_encontrados,
+            elementos_requeridos=_TOTAL_ELEMENTOS_OBLIGATORIOS
+        )
 
-    def validar_convenciones_nomenclatura(self, contenido_locals: str, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_convenciones_nomenclatura(self, contenido_locals: str, contenido_main: str) -> ResultadoValidacion:
         """REGLA B2: Validar convenciones de nomenclatura obligatorias"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        caracteristicas = extraer_caracteristicas_locals(contenido_locals)
         
         # Verificar que locals.tf contenga resource_names
-        if "resource_names" not in contenido_locals:
-            errores.append("❌ locals.tf debe contener 'resource_names' con convención de nomenclatura")
+        if not caracteristicas.tiene_resource_names:
+            errores.append(mensaje(CodigoMensaje.B2_SIN_RESOURCE_NAMES))
         
         # Verificar patrón de nomenclatura en locals
-        patron_esperado = r'\$\{var\.client\}-\$\{var\.project\}-\$\{var\.environment\}'
-        if not re.search(patron_esperado, contenido_locals):
-            errores.append("❌ Convención de nomenclatura no implementada: {client}-{project}-{environment}-{type}-{key}")
+        if not caracteristicas.tiene_nomenclatura:
+            errores.append(mensaje(CodigoMensaje.B2_NOMENCLATURA_NO_IMPLEMENTADA))
         
         # Verificar uso de resource_names en main.tf
         if "local.resource_names" not in contenido_main:
-            advertencias.append("⚠️ main.tf no usa local.resource_names para nombres de recursos")
+            advertencias.append(mensaje(CodigoMensaje.B2_MAIN_SIN_RESOURCE_NAMES))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_variables_obligatorias(self, contenido_variables: str) -> Dict[str, Any]:
+    def validar_variables_obligatorias(self, contenido_variables: str) -> ResultadoValidacion:
         """REGLA B3: Validar variables obligatorias (client, project, environment)"""
-        errores = []
-        advertencias = []
-        variables_encontradas = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        variables_por_nombre = parsear_terraform(contenido_variables).variables_por_nombre
+        variables_encontradas = tuple(variable for variable in _VARIABLES_OBLIGATORIAS if variable in variables_por_nombre)
         
         # Verificar cada variable obligatoria
-        for variable in self.variables_obligatorias:
-            patron = rf'variable\s+"{variable}"\s*\{{'
-            if re.search(patron, contenido_variables):
-                variables_encontradas.append(variable)
-                
+        for variable in _VARIABLES_OBLIGATORIAS:
+            bloque = variables_por_nombre.get(variable)
+            if bloque:
                 # Verificar que tenga description
-                patron_description = rf'variable\s+"{variable}"[^}}]*description\s*='
-                if not re.search(patron_description, contenido_variables, re.DOTALL):
-                    errores.append(f"❌ Variable '{variable}' sin description obligatorio")
+                if not bloque.define_atributo("description"):
+                    errores.append(mensaje(CodigoMensaje.B3_VARIABLE_SIN_DESCRIPTION, variable))
                 
                 # Verificar validación para environment
                 if variable == "environment":
-                    patron_validation = rf'variable\s+"{variable}"[^}}]*validation\s*\{{'
-                    if not re.search(patron_validation, contenido_variables, re.DOTALL):
-                        errores.append("❌ Variable 'environment' debe tener validación con valores permitidos")
+                    if not bloque.contiene_bloque("validation"):
+                        errores.append(mensaje(CodigoMensaje.B3_ENVIRONMENT_SIN_VALIDACION))
             else:
-                errores.append(f"❌ Variable obligatoria faltante: {variable}")
+                errores.append(mensaje(CodigoMensaje.B3_VARIABLE_FALTANTE, variable))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "variables_encontradas": variables_encontradas
-        }
+        return construir_resultado(
+            errores,
+            advertencias,
+            variables_encontradas=variables_encontradas
+        )
 
-    def validar_sistema_etiquetado(self, contenido_providers: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_sistema_etiquetado(self, contenido_providers: str, contenido_main: str) -> ResultadoValidacion:
         """REGLA B4: Validar sistema de etiquetado de 2 niveles"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        presentes_main = _ESCANER_ETIQUETADO_MAIN.presentes(contenido_main)
         
         # Verificar default_tags en provider (debe estar en el consumidor, no en el módulo)
         if "default_tags" in contenido_providers:
-            advertencias.append("⚠️ default_tags debe estar en el provider del consumidor, no en el módulo")
+            advertencias.append(mensaje(CodigoMensaje.B4_DEFAULT_TAGS_EN_MODULO))
         
         # Verificar estructura de tags en recursos
-        if "tags = merge(" not in contenido_main:
-            errores.append("❌ Recursos deben usar merge() para combinar tags")
+        if "tags = merge(" not in presentes_main:
+            errores.append(mensaje(CodigoMensaje.B4_SIN_MERGE))
         
         # Verificar que se use Name tag
-        if '"Name"' not in contenido_main:
-            errores.append("❌ Recursos deben incluir tag 'Name' con convención de nomenclatura")
+        if '"Name"' not in presentes_main:
+            errores.append(mensaje(CodigoMensaje.B4_SIN_NAME))
         
         # Verificar additional_tags en variables
-        if "additional_tags" not in contenido_main:
-            advertencias.append("⚠️ Considerar agregar soporte para additional_tags específicos por recurso")
+        if "additional_tags" not in presentes_main:
+            advertencias.append(mensaje(CodigoMensaje.B4_SIN_ADDITIONAL_TAGS))
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_sample_funcional(self, ruta_sample: str) -> Dict[str, Any]:
+    def validar_sample_funcional(self, ruta_sample: str) -> ResultadoValidacion:
         """REGLA B5: Validar que sample/ sea completamente funcional"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        entradas_sample = _entradas_directorio(ruta_sample)
         
         # Verificar terraform.tfvars.sample
         tfvars_path = os.path.join(ruta_sample, "terraform.tfvars.sample")
-        if os.path.exists(tfvars_path):
+        if "terraform.tfvars.sample" in entradas_sample:
             try:
-                with open(tfvars_path, 'r') as f:
+                # Lectura binaria: los literales buscados son ASCII, no hace falta decodificar
+                with open(tfvars_path, 'rb') as f:
                     contenido = f.read()
                     
                 # Verificar variables obligatorias en el ejemplo
-                for variable in self.variables_obligatorias:
-                    if variable not in contenido:
-                        errores.append(f"❌ terraform.tfvars.sample falta variable: {variable}")
+                for variable, variable_bytes in _VARIABLES_OBLIGATORIAS_BYTES:
+                    if variable_bytes not in contenido:
+                        errores.append(mensaje(CodigoMensaje.B5_TFVARS_FALTA_VARIABLE, variable))
                 
                 # Verificar que no use placeholders
-                if "[" in contenido and "]" in contenido:
-                    advertencias.append("⚠️ terraform.tfvars.sample contiene placeholders, debe tener valores reales")
+                if b"[" in contenido and b"]" in contenido:
+                    advertencias.append(mensaje(CodigoMensaje.B5_TFVARS_PLACEHOLDERS))
                     
             except Exception as e:
-                errores.append(f"❌ Error leyendo terraform.tfvars.sample: {str(e)}")
+                errores.append(mensaje(CodigoMensaje.B5_TFVARS_ERROR_LECTURA, str(e)))
         else:
-            errores.append("❌ terraform.tfvars.sample faltante")
+            errores.append(mensaje(CodigoMensaje.B5_TFVARS_FALTANTE))
         
         # Verificar README.md del sample
-        readme_sample = os.path.join(ruta_sample, "README.md")
-        if not os.path.exists(readme_sample):
-            errores.append("❌ sample/README.md faltante")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        if "README.md" not in entradas_sample:
+            errores.append(mensaje(CodigoMensaje.B5_README_FALTANTE))
+        
+        return construir_resultado(errores, advertencias)
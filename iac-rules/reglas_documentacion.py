@@ -7,235 +7,91 @@ Implementa estándares de documentación obligatorios según Pragma CloudOps
 import re
 import os
 import datetime
-from typing import Dict, Any, List
-
-class ReglasDocumentacion:
-    """Implementa las reglas de documentación D1-D7 para módulos Terraform"""
-    
-    def __init__(self):
-        # REGLA D1: Secciones README obligatorias
-        self.secciones_readme_obligatorias = [
-            "# Módulo Terraform:",
-            "## Descripción",
-            "## Diagrama de Arquitectura", 
-            "## Características",
-            "## Estructura del Módulo",
-            "## Implementación y Configuración",
-            "## Parámetros de Entrada",
-            "## Estructura de Configuración",
-            "## Valores de Salida",
-            "## Ejemplos de Uso",
-            "## Consideraciones de Seguridad",
-            "## Contribución"
-        ]
-
-    def validar_readme_estructura_completa(self, contenido_readme: str) -> Dict[str, Any]:
-        """REGLA D1: Validar estructura obligatoria completa del README.md"""
-        errores = []
-        advertencias = []
-        secciones_encontradas = []
-        
-        for seccion in self.secciones_readme_obligatorias:
-            if seccion in contenido_readme:
-                secciones_encontradas.append(seccion)
-            else:
-                errores.append(f"❌ Sección obligatoria faltante en README.md: {seccion}")
-        
-        # Verificar orden de secciones
-        posiciones = []
-        for seccion in secciones_encontradas:
-            pos = contenido_readme.find(seccion)
-            if pos != -1:
-                posiciones.append((pos, seccion))
-        
-        posiciones.sort()
-        orden_actual = [seccion for _, seccion in posiciones]
-        
-        if orden_actual != [s for s in self.secciones_readme_obligatorias if s in secciones_encontradas]:
-            errores.append("❌ Las secciones del README.md no están en el orden correcto")
-        
-        # Verificar elementos específicos obligatorios
-        elementos_obligatorios = [
-            "## Requisitos Técnicos",
-            "| Requisito | Versión |",
-            "### Configuración del Provider",
-            "### Convenciones de Nomenclatura",
-            "## Consideraciones de Seguridad"
-        ]
-        
-        for elemento in elementos_obligatorios:
-            if elemento not in contenido_readme:
-                errores.append(f"❌ Elemento obligatorio faltante: {elemento}")
-        
-        # Verificar que tenga ejemplos funcionales
-        if "### Ejemplo Básico" not in contenido_readme:
-            errores.append("❌ README debe incluir 'Ejemplo Básico'")
-        
-        if "### Ejemplo Avanzado" not in contenido_readme:
-            errores.append("❌ README debe incluir 'Ejemplo Avanzado'")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "secciones_encontradas": len(secciones_encontradas),
-            "secciones_requeridas": len(self.secciones_readme_obligatorias)
-        }
-
-    def validar_changelog_formato_completo(self, contenido_changelog: str) -> Dict[str, Any]:
-        """REGLA D2: Validar formato completo obligatorio del CHANGELOG.md"""
-        errores = []
-        advertencias = []
-        
-        elementos_obligatorios = [
-            "# Changelog",
-            "[Keep a Changelog]",
-            "[Semantic Versioning]",
-            "## [Unreleased]",
-            "### Added",
-            "### Changed", 
-            "### Deprecated",
-            "### Removed",
-            "### Fixed",
-            "### Security"
-        ]
-        
-        for elemento in elementos_obligatorios:
-            if elemento not in contenido_changelog:
-                errores.append(f"❌ Elemento obligatorio faltante en CHANGELOG.md: {elemento}")
-        
-        # Verificar formato de versiones
-        patron_version = r"\[(\d+\.\d+\.\d+)\] - \d{4}-\d{2}-\d{2}"
-        versiones = re.findall(patron_version, contenido_changelog)
-        
-        if not versiones:
-            errores.append("❌ No se encontraron versiones con formato correcto [X.Y.Z] - YYYY-MM-DD")
-        
-        # Verificar que tenga contenido en secciones
-        if "- N/A" in contenido_changelog:
-            advertencias.append("⚠️ Algunas secciones contienen 'N/A', considerar agregar contenido específico")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "versiones_encontradas": versiones
-        }
-
-    def validar_sample_readme(self, contenido_sample_readme: str) -> Dict[str, Any]:
-        """REGLA D3: Validar documentación del directorio sample/"""
-        errores = []
-        advertencias = []
-        
-        elementos_obligatorios_sample = [
-            "# Ejemplo de Uso",
-            "## Descripción",
-            "## Estructura",
-            "## Uso Rápido",
-            "### 1. Preparación",
-            "### 2. Despliegue",
-            "### 3. Verificación",
-            "### 4. Limpieza"
-        ]
-        
-        for elemento in elementos_obligatorios_sample:
-            if elemento not in contenido_sample_readme:
-                errores.append(f"❌ Elemento obligatorio faltante en sample/README.md: {elemento}")
-        
-        # Verificar que tenga comandos terraform
-        comandos_terraform = ["terraform init", "terraform plan", "terraform apply", "terraform destroy"]
-        for comando in comandos_terraform:
-            if comando not in contenido_sample_readme:
-                errores.append(f"❌ sample/README.md debe incluir comando: {comando}")
-        
-        # Verificar que mencione terraform.tfvars.sample
-        if "terraform.tfvars.sample" not in contenido_sample_readme:
-            errores.append("❌ sample/README.md debe mencionar terraform.tfvars.sample")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
-
-    def validar_terraform_docs_configuracion(self, ruta_modulo: str) -> Dict[str, Any]:
-        """REGLA D4: Validar configuración de terraform-docs"""
-        errores = []
-        advertencias = []
-        
-        # Verificar archivo .terraform-docs.yml
-        terraform_docs_path = os.path.join(ruta_modulo, ".terraform-docs.yml")
-        if not os.path.exists(terraform_docs_path):
-            errores.append("❌ Archivo .terraform-docs.yml faltante")
-        else:
-            try:
-                with open(terraform_docs_path, 'r') as f:
-                    contenido = f.read()
-                    
-                elementos_requeridos = [
-                    'formatter: "markdown table"',
-                    'output:',
-                    'file: "README.md"',
-                    'mode: inject',
-                    'sort:',
-                    'enabled: true'
-                ]
-                
-                for elemento in elementos_requeridos:
-                    if elemento not in contenido:
-                        errores.append(f"❌ Configuración terraform-docs faltante: {elemento}")
-                
-                # Verificar template con BEGIN_TF_DOCS
-                if "BEGIN_TF_DOCS" not in contenido:
-                    errores.append("❌ Template debe incluir marcadores BEGIN_TF_DOCS/END_TF_DOCS")
-                        
-            except Exception as e:
-                errores.append(f"❌ Error leyendo .terraform-docs.yml: {str(e)}")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
-
-    def validar_descriptions_obligatorios(self, contenido_variables: str, contenido_outputs: str) -> Dict[str, Any]:
-        """REGLA D4: Validar descriptions obligatorios en variables y outputs"""
-        errores = []
-        advertencias = []
-        
-        # Validar descriptions en variables
-        patron_variables = r'variable\s+"([^"]+)"\s*\{'
-        variables = re.findall(patron_variables, contenido_variables)
-        
-        for variable in variables:
-            patron_description = rf'variable\s+"{variable}"[^}}]*description\s*='
-            if not re.search(patron_description, contenido_variables, re.DOTALL):
-                errores.append(f"❌ Variable '{variable}' sin description obligatorio")
-        
-        # Validar descriptions en outputs
-        patron_outputs = r'output\s+"([^"]+)"\s*\{'
-        outputs = re.findall(patron_outputs, contenido_outputs)
-        
-        for output in outputs:
-            patron_description = rf'output\s+"{output}"[^}}]*description\s*='
-            if not re.search(patron_description, contenido_outputs, re.DOTALL):
-                errores.append(f"❌ Output '{output}' sin description obligatorio")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias,
-            "variables_analizadas": len(variables),
-            "outputs_analizados": len(outputs)
-        }
-
-    # ========== FUNCIONES DE GENERACIÓN DE PLANTILLAS ==========
-    
-    def obtener_plantilla_readme_completa(self, nombre_modulo: str, tipo_recurso: str = "recurso") -> str:
-        """Generar plantilla completa de README.md según todas las reglas"""
-        fecha_actual = datetime.datetime.now().strftime("%Y-%m-%d")
-        
-        return f"""# Módulo Terraform: {nombre_modulo}
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Final, Iterable, List, Optional, Sequence, Tuple
+
+from .escaneo_literales import EscanerLiterales
+from .mensajes import CodigoMensaje, mensaje
+from .parser_terraform import parsear_terraform
+from .resultados import ResultadoValidacion, como_dict, construir_resultado
+
+# Patrones precompilados (se compilan una sola vez al importar el módulo)
+_RE_VERSION = re.compile(r"\[(\d+\.\d+\.\d+)\] - \d{4}-\d{2}-\d{2}")
+
+# REGLA D1: Secciones README obligatorias (en el orden exigido)
+_SECCIONES_README: Final[Tuple[str, ...]] = (
+    "# Módulo Terraform:",
+    "## Descripción",
+    "## Diagrama de Arquitectura",
+    "## Características",
+    "## Estructura del Módulo",
+    "## Implementación y Configuración",
+    "## Parámetros de Entrada",
+    "## Estructura de Configuración",
+    "## Valores de Salida",
+    "## Ejemplos de Uso",
+    "## Consideraciones de Seguridad",
+    "## Contribución"
+)
+_INDICE_SECCION_README = {seccion: indice for indice, seccion in enumerate(_SECCIONES_README)}
+
+_ELEMENTOS_README: Final[Tuple[str, ...]] = (
+    "## Requisitos Técnicos",
+    "| Requisito | Versión |",
+    "### Configuración del Provider",
+    "### Convenciones de Nomenclatura",
+    "## Consideraciones de Seguridad"
+)
+
+# REGLA D2: Elementos obligatorios del CHANGELOG.md
+_ELEMENTOS_CHANGELOG: Final[Tuple[str, ...]] = (
+    "# Changelog",
+    "[Keep a Changelog]",
+    "[Semantic Versioning]",
+    "## [Unreleased]",
+    "### Added",
+    "### Changed",
+    "### Deprecated",
+    "### Removed",
+    "### Fixed",
+    "### Security"
+)
+
+# REGLA D3: Elementos obligatorios de sample/README.md
+_ELEMENTOS_SAMPLE_README: Final[Tuple[str, ...]] = (
+    "# Ejemplo de Uso",
+    "## Descripción",
+    "## Estructura",
+    "## Uso Rápido",
+    "### 1. Preparación",
+    "### 2. Despliegue",
+    "### 3. Verificación",
+    "### 4. Limpieza"
+)
+
+_COMANDOS_TERRAFORM: Final[Tuple[str, ...]] = ("terraform init", "terraform plan", "terraform apply", "terraform destroy")
+
+# REGLA D4: Claves obligatorias de .terraform-docs.yml
+_ELEMENTOS_TERRAFORM_DOCS: Final[Tuple[str, ...]] = (
+    'formatter: "markdown table"',
+    'output:',
+    'file: "README.md"',
+    'mode: inject',
+    'sort:',
+    'enabled: true'
+)
+# .terraform-docs.yml se escanea en binario: las claves son ASCII, no hace falta decodificar
+_ELEMENTOS_TERRAFORM_DOCS_BYTES = tuple((elemento, elemento.encode()) for elemento in _ELEMENTOS_TERRAFORM_DOCS)
+
+# Un escáner por documento: todos sus literales se buscan en una sola pasada
+_ESCANER_README = EscanerLiterales(_SECCIONES_README + _ELEMENTOS_README + ("### Ejemplo Básico", "### Ejemplo Avanzado"))
+_ESCANER_CHANGELOG = EscanerLiterales(_ELEMENTOS_CHANGELOG + ("- N/A",))
+_ESCANER_SAMPLE_README = EscanerLiterales(_ELEMENTOS_SAMPLE_README + _COMANDOS_TERRAFORM + ("terraform.tfvars.sample",))
+
+
+# Plantillas de generación (str.format: las llaves literales van dobladas)
+_PLANTILLA_README = """# Módulo Terraform: {nombre_modulo}
 
 ## Descripción
 [Descripción concisa del propósito del módulo, características clave y casos de uso principales]
@@ -410,11 +266,7 @@ Para soporte técnico, contactar al equipo CloudOps de Pragma.
 <!-- END_TF_DOCS -->
 """
 
-    def obtener_plantilla_changelog_completa(self) -> str:
-        """Generar plantilla completa de CHANGELOG.md"""
-        fecha_actual = datetime.datetime.now().strftime("%Y-%m-%d")
-        
-        return f"""# Changelog
+_PLANTILLA_CHANGELOG = """# Changelog
 
 Todos los cambios notables a este módulo serán documentados en este archivo.
 
@@ -450,41 +302,7 @@ y este proyecto adhiere a [Semantic Versioning](https://semver.org/spec/v2.0.0.h
 - Políticas de menor privilegio aplicadas
 """
 
-    def obtener_configuracion_terraform_docs(self) -> str:
-        """Generar configuración completa de .terraform-docs.yml"""
-        return '''formatter: "markdown table"
-
-output:
-  file: "README.md"
-  mode: inject
-  template: |-
-    <!-- BEGIN_TF_DOCS -->
-    {{ .Content }}
-    <!-- END_TF_DOCS -->
-
-sort:
-  enabled: true
-  by: name
-
-settings:
-  anchor: true
-  color: true
-  default: true
-  description: true
-  escape: true
-  hide-empty: false
-  html: true
-  indent: 2
-  lockfile: true
-  read-comments: true
-  required: true
-  sensitive: true
-  type: true
-'''
-
-    def obtener_plantilla_sample_readme(self, nombre_modulo: str) -> str:
-        """Generar plantilla de sample/README.md"""
-        return f"""# Ejemplo de Uso - {nombre_modulo}
+_PLANTILLA_SAMPLE_README = """# Ejemplo de Uso - {nombre_modulo}
 
 ## Descripción
 Este directorio contiene un ejemplo funcional completo del módulo {nombre_modulo}.
@@ -563,3 +381,284 @@ resource_config = {{
 - Todos los recursos creados tienen nombres únicos usando la convención establecida
 - Las configuraciones de seguridad están habilitadas por defecto
 """
+
+
+# La plantilla sólo depende de la fecha: una entrada por día
+@lru_cache(maxsize=8)
+def _plantilla_changelog(fecha_actual: str) -> str:
+    """Plantilla de CHANGELOG.md con la versión inicial fechada"""
+    return _PLANTILLA_CHANGELOG.format(fecha_actual=fecha_actual)
+
+
+# Configuración fija de terraform-docs (no depende de argumentos)
+_CONFIGURACION_TERRAFORM_DOCS = '''formatter: "markdown table"
+
+output:
+  file: "README.md"
+  mode: inject
+  template: |-
+    <!-- BEGIN_TF_DOCS -->
+    {{ .Content }}
+    <!-- END_TF_DOCS -->
+
+sort:
+  enabled: true
+  by: name
+
+settings:
+  anchor: true
+  color: true
+  default: true
+  description: true
+  escape: true
+  hide-empty: false
+  html: true
+  indent: 2
+  lockfile: true
+  read-comments: true
+  required: true
+  sensitive: true
+  type: true
+'''
+
+
+# Validaciones disponibles en validar_lote: tipo -> método de ReglasDocumentacion
+_VALIDACIONES_LOTE = {
+    "readme": "validar_readme_estructura_completa",
+    "changelog": "validar_changelog_formato_completo",
+    "sample_readme": "validar_sample_readme",
+    "terraform_docs": "validar_terraform_docs_configuracion",
+    "descriptions": "validar_descriptions_obligatorios"
+}
+
+
+def _ejecutar_validacion_lote(metodo: str, argumentos: Sequence[str]) -> Dict[str, Any]:
+    """Worker de validar_lote: aplica una regla de documentación en el proceso actual"""
+    # Los validadores son estáticos: no hace falta instanciar ReglasDocumentacion en el worker.
+    # Como el worker de ReglasIaCManager, devuelve un dict plano (como_dict) entre procesos
+    return como_dict(getattr(ReglasDocumentacion, metodo)(*argumentos))
+
+
+class ReglasDocumentacion:
+    """Implementa las reglas de documentación D1-D7 para módulos Terraform"""
+    
+    def __init__(self):
+        # REGLA D1: Secciones README obligatorias
+        self.secciones_readme_obligatorias = _SECCIONES_README
+
+    @staticmethod
+    def validar_readme_estructura_completa(contenido_readme: str) -> ResultadoValidacion:
+        """REGLA D1: Validar estructura obligatoria completa del README.md"""
+        errores = []
+        advertencias = []
+        
+        # Primera posición de cada literal, en una sola pasada sobre el README
+        posiciones_readme = _ESCANER_README.posiciones(contenido_readme)
+        
+        posiciones = []
+        for seccion in _SECCIONES_README:
+            posicion = posiciones_readme.get(seccion)
+            if posicion is not None:
+                posiciones.append((posicion, seccion))
+            else:
+                errores.append(mensaje(CodigoMensaje.D1_SECCION_FALTANTE, seccion))
+        
+        # Verificar orden de secciones: leídas por posición, sus índices deben ser crecientes
+        indices = [_INDICE_SECCION_README[seccion] for _, seccion in sorted(posiciones)]
+        if any(anterior > siguiente for anterior, siguiente in zip(indices, indices[1:])):
+            errores.append(mensaje(CodigoMensaje.D1_ORDEN_SECCIONES))
+        
+        # Verificar elementos específicos obligatorios
+        errores.extend(
+            mensaje(CodigoMensaje.D1_ELEMENTO_FALTANTE, elemento)
+            for elemento in _ELEMENTOS_README
+            if elemento not in posiciones_readme
+        )
+        
+        # Verificar que tenga ejemplos funcionales
+        if "### Ejemplo Básico" not in posiciones_readme:
+            errores.append(mensaje(CodigoMensaje.D1_SIN_EJEMPLO_BASICO))
+        
+        if "### Ejemplo Avanzado" not in posiciones_readme:
+            errores.append(mensaje(CodigoMensaje.D1_SIN_EJEMPLO_AVANZADO))
+        
+        return construir_resultado(
+            errores, advertencias,
+            secciones_encontradas=len(posiciones),
+            secciones_requeridas=len(_SECCIONES_README)
+        )
+
+    @staticmethod
+    def readme_valido_rapido(contenido_readme: str) -> bool:
+        """REGLA D1 sin diagnóstico: se detiene en el primer elemento faltante o fuera de orden"""
+        anterior = -1
+        for seccion in _SECCIONES_README:
+            posicion = contenido_readme.find(seccion)
+            if posicion == -1 or posicion < anterior:
+                return False
+            anterior = posicion
+        return all(
+            elemento in contenido_readme
+            for elemento in _ELEMENTOS_README + ("### Ejemplo Básico", "### Ejemplo Avanzado")
+        )
+
+    @staticmethod
+    def validar_changelog_formato_completo(contenido_changelog: str) -> ResultadoValidacion:
+        """REGLA D2: Validar formato completo obligatorio del CHANGELOG.md"""
+        errores = []
+        advertencias = []
+        
+        presentes = _ESCANER_CHANGELOG.presentes(contenido_changelog)
+        
+        errores.extend(
+            mensaje(CodigoMensaje.D2_ELEMENTO_FALTANTE, elemento)
+            for elemento in _ELEMENTOS_CHANGELOG
+            if elemento not in presentes
+        )
+        
+        # Verificar formato de versiones
+        versiones = _RE_VERSION.findall(contenido_changelog)
+        
+        if not versiones:
+            errores.append(mensaje(CodigoMensaje.D2_SIN_VERSIONES))
+        
+        # Verificar que tenga contenido en secciones
+        if "- N/A" in presentes:
+            advertencias.append(mensaje(CodigoMensaje.D2_SECCIONES_NA))
+        
+        return construir_resultado(errores, advertencias, versiones_encontradas=tuple(versiones))
+
+    @staticmethod
+    def validar_sample_readme(contenido_sample_readme: str) -> ResultadoValidacion:
+        """REGLA D3: Validar documentación del directorio sample/"""
+        errores = []
+        advertencias = []
+        
+        presentes = _ESCANER_SAMPLE_README.presentes(contenido_sample_readme)
+        
+        errores.extend(
+            mensaje(CodigoMensaje.D3_ELEMENTO_FALTANTE, elemento)
+            for elemento in _ELEMENTOS_SAMPLE_README
+            if elemento not in presentes
+        )
+        
+        # Verificar que tenga comandos terraform
+        errores.extend(
+            mensaje(CodigoMensaje.D3_SIN_COMANDO, comando)
+            for comando in _COMANDOS_TERRAFORM
+            if comando not in presentes
+        )
+        
+        # Verificar que mencione terraform.tfvars.sample
+        if "terraform.tfvars.sample" not in presentes:
+            errores.append(mensaje(CodigoMensaje.D3_SIN_TFVARS))
+        
+        return construir_resultado(errores, advertencias)
+
+    @staticmethod
+    def validar_terraform_docs_configuracion(ruta_modulo: str) -> ResultadoValidacion:
+        """REGLA D4: Validar configuración de terraform-docs"""
+        errores = []
+        advertencias = []
+        
+        # Verificar archivo .terraform-docs.yml (abrir directamente: sin exists() previo)
+        terraform_docs_path = os.path.join(ruta_modulo, ".terraform-docs.yml")
+        try:
+            with open(terraform_docs_path, 'rb') as f:
+                contenido = f.read()
+        except FileNotFoundError:
+            errores.append(mensaje(CodigoMensaje.D4_TFDOCS_FALTANTE))
+        except OSError as e:
+            errores.append(mensaje(CodigoMensaje.D4_TFDOCS_ERROR_LECTURA, str(e)))
+        else:
+            errores.extend(
+                mensaje(CodigoMensaje.D4_TFDOCS_CLAVE_FALTANTE, elemento)
+                for elemento, elemento_bytes in _ELEMENTOS_TERRAFORM_DOCS_BYTES
+                if elemento_bytes not in contenido
+            )
+            
+            # Verificar template con BEGIN_TF_DOCS
+            if b"BEGIN_TF_DOCS" not in contenido:
+                errores.append(mensaje(CodigoMensaje.D4_TFDOCS_SIN_MARCADORES))
+        
+        return construir_resultado(errores, advertencias)
+
+    @staticmethod
+    def validar_descriptions_obligatorios(contenido_variables: str, contenido_outputs: str) -> ResultadoValidacion:
+        """REGLA D4: Validar descriptions obligatorios en variables y outputs"""
+        errores = []
+        advertencias = []
+        
+        # Un solo recorrido por archivo: cada bloque se revisa dentro de su propio cuerpo
+        variables = parsear_terraform(contenido_variables).variables
+        outputs = parsear_terraform(contenido_outputs).outputs
+        
+        # Validar descriptions en variables
+        errores.extend(
+            mensaje(CodigoMensaje.D4_VARIABLE_SIN_DESCRIPTION, variable.nombre)
+            for variable in variables
+            if not variable.define_atributo("description")
+        )
+        
+        # Validar descriptions en outputs
+        errores.extend(
+            mensaje(CodigoMensaje.D4_OUTPUT_SIN_DESCRIPTION, output.nombre)
+            for output in outputs
+            if not output.define_atributo("description")
+        )
+        
+        return construir_resultado(
+            errores, advertencias,
+            variables_analizadas=len(variables),
+            outputs_analizados=len(outputs)
+        )
+
+    def validar_lote(self, items: Iterable[Dict[str, Any]], max_workers: Optional[int] = None) -> List[ResultadoValidacion]:
+        """Validar muchos documentos en paralelo con un pool de procesos
+
+        Cada item es {"tipo": <clave de _VALIDACIONES_LOTE>, "argumentos": [...]} con
+        los mismos argumentos que el validador; los resultados conservan el orden.
+        """
+        resultados: List[Optional[ResultadoValidacion]] = []
+        tareas = []
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            for item in items:
+                tipo = item.get("tipo")
+                metodo = _VALIDACIONES_LOTE.get(tipo)
+                if metodo is None:
+                    resultados.append(construir_resultado([mensaje(CodigoMensaje.D_LOTE_TIPO_NO_RECONOCIDO, tipo)], []))
+                    continue
+                tareas.append((len(resultados), executor.submit(_ejecutar_validacion_lote, metodo, tuple(item.get("argumentos", ())))))
+                resultados.append(None)
+            
+            for indice, futuro in tareas:
+                try:
+                    resultados[indice] = ResultadoValidacion.desde_mapping(futuro.result())
+                except Exception as e:
+                    resultados[indice] = construir_resultado([mensaje(CodigoMensaje.D_LOTE_ERROR_EJECUCION, str(e))], [])
+        
+        return resultados
+
+    # ========== FUNCIONES DE GENERACIÓN DE PLANTILLAS ==========
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def obtener_plantilla_readme_completa(nombre_modulo: str, tipo_recurso: str = "recurso") -> str:
+        """Generar plantilla completa de README.md según todas las reglas"""
+        return _PLANTILLA_README.format_map({"nombre_modulo": nombre_modulo, "tipo_recurso": tipo_recurso})
+
+    @staticmethod
+    def obtener_plantilla_changelog_completa() -> str:
+        """Generar plantilla completa de CHANGELOG.md"""
+        return _plantilla_changelog(datetime.date.today().isoformat())
+
+    @staticmethod
+    def obtener_configuracion_terraform_docs() -> str:
+        """Generar configuración completa de .terraform-docs.yml"""
+        return _CONFIGURACION_TERRAFORM_DOCS
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def obtener_plantilla_sample_readme(nombre_modulo: str) -> str:
+        """Generar plantilla de sample/README.md"""
+        return _PLANTILLA_SAMPLE_README.format_map({"nombre_modulo": nombre_modulo})
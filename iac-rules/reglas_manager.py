@@ -5,120 +5,323 @@ Orquesta todas las categorías de reglas y proporciona una interfaz unificada
 """
 
 import datetime
-from typing import Dict, Any, List
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .resultados import ResultadoValidacion, como_dict
+
+if TYPE_CHECKING:
+    from .reglas_basicas import ReglasBasicas
+    from .reglas_avanzadas import ReglasAvanzadas
+    from .reglas_seguridad import ReglasSeguridad
+    from .reglas_documentacion import ReglasDocumentacion
+
+# Categorías de reglas internadas: las comparaciones y búsquedas en dicts se resuelven por identidad
+_CATEGORIA_BASICAS = sys.intern("básicas")
+_CATEGORIA_AVANZADAS = sys.intern("avanzadas")
+_CATEGORIA_SEGURIDAD = sys.intern("seguridad")
+_CATEGORIA_DOCUMENTACION = sys.intern("documentación")
+
+# Validaciones de contenido de validar_modulo: (nombre, categoría, método del manager, archivos relativos al módulo)
+_VALIDACIONES_CONTENIDO: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    ("convenciones_nomenclatura", _CATEGORIA_BASICAS, "validar_convenciones_nomenclatura", ("locals.tf", "main.tf")),
+    ("variables_obligatorias", _CATEGORIA_BASICAS, "validar_variables_obligatorias", ("variables.tf",)),
+    ("sistema_etiquetado", _CATEGORIA_BASICAS, "validar_sistema_etiquetado", ("providers.tf", "main.tf")),
+    ("tipos_datos", _CATEGORIA_AVANZADAS, "validar_tipos_datos_inteligentes", ("variables.tf",)),
+    ("for_each", _CATEGORIA_AVANZADAS, "validar_for_each_obligatorio", ("main.tf",)),
+    ("validaciones_variables", _CATEGORIA_AVANZADAS, "validar_validaciones_variables", ("variables.tf",)),
+    ("transformaciones_locals", _CATEGORIA_AVANZADAS, "validar_transformaciones_simples_locals", ("locals.tf",)),
+    ("outputs_descriptivos", _CATEGORIA_AVANZADAS, "validar_outputs_descriptivos", ("outputs.tf",)),
+    ("provider_configuracion", _CATEGORIA_AVANZADAS, "validar_provider_configuracion", ("providers.tf",)),
+    ("cifrado_obligatorio", _CATEGORIA_SEGURIDAD, "validar_cifrado_obligatorio", ("variables.tf", "main.tf")),
+    ("acceso_publico", _CATEGORIA_SEGURIDAD, "validar_acceso_publico_bloqueado", ("variables.tf", "main.tf")),
+    ("force_ssl_tls", _CATEGORIA_SEGURIDAD, "validar_force_ssl_tls", ("main.tf", "data.tf")),
+    ("menor_privilegio", _CATEGORIA_SEGURIDAD, "validar_politicas_menor_privilegio", ("variables.tf", "data.tf")),
+    ("logging_monitoreo", _CATEGORIA_SEGURIDAD, "validar_logging_monitoreo", ("variables.tf", "main.tf")),
+    ("configuracion_redes", _CATEGORIA_SEGURIDAD, "validar_configuracion_redes", ("main.tf",)),
+    ("readme_estructura", _CATEGORIA_DOCUMENTACION, "validar_readme_estructura_completa", ("README.md",)),
+    ("changelog_formato", _CATEGORIA_DOCUMENTACION, "validar_changelog_formato_completo", ("CHANGELOG.md",)),
+    ("sample_readme", _CATEGORIA_DOCUMENTACION, "validar_sample_readme", (os.path.join("sample", "README.md"),)),
+    ("descriptions_obligatorios", _CATEGORIA_DOCUMENTACION, "validar_descriptions_obligatorios", ("variables.tf", "outputs.tf")),
+)
+
+_VERSION_REGLAS = "2.0.0"
+_CATEGORIAS_REGLAS = (_CATEGORIA_BASICAS, _CATEGORIA_AVANZADAS, _CATEGORIA_SEGURIDAD, _CATEGORIA_DOCUMENTACION)
+
+# Estadísticas de obtener_estadisticas_reglas: datos constantes por versión, de sólo lectura
+_REGLAS_POR_CATEGORIA: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    _CATEGORIA_BASICAS: (
+        "validar_estructura_modulo_completa",
+        "validar_convenciones_nomenclatura",
+        "validar_variables_obligatorias",
+        "validar_sistema_etiquetado",
+        "validar_sample_funcional"
+    ),
+    _CATEGORIA_AVANZADAS: (
+        "validar_tipos_datos_inteligentes",
+        "validar_for_each_obligatorio",
+        "validar_validaciones_variables",
+        "validar_transformaciones_simples_locals",
+        "validar_outputs_descriptivos",
+        "validar_provider_configuracion"
+    ),
+    _CATEGORIA_SEGURIDAD: (
+        "validar_cifrado_obligatorio",
+        "validar_acceso_publico_bloqueado",
+        "validar_force_ssl_tls",
+        "validar_politicas_menor_privilegio",
+        "validar_logging_monitoreo",
+        "validar_configuracion_redes"
+    ),
+    _CATEGORIA_DOCUMENTACION: (
+        "validar_readme_estructura_completa",
+        "validar_changelog_formato_completo",
+        "validar_sample_readme",
+        "validar_terraform_docs_configuracion",
+        "validar_descriptions_obligatorios"
+    )
+})
+
+_ESTADISTICAS_REGLAS: Mapping[str, Any] = MappingProxyType({
+    "version": _VERSION_REGLAS,
+    "categorias_disponibles": _CATEGORIAS_REGLAS,
+    "total_categorias": len(_CATEGORIAS_REGLAS),
+    "reglas_por_categoria": _REGLAS_POR_CATEGORIA,
+    "herramientas_generacion": (
+        "obtener_plantilla_readme_completa",
+        "obtener_plantilla_changelog_completa",
+        "obtener_configuracion_terraform_docs",
+        "obtener_plantilla_sample_readme"
+    )
+})
+
+
+@lru_cache(maxsize=128)
+def _leer_cacheado(ruta: str, mtime_ns: int, tamano: int) -> str:
+    """Contenido de un archivo; mtime_ns y tamaño forman parte de la clave, así un archivo modificado se vuelve a leer"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _leer_archivo(ruta: str) -> str:
+    """Leer un archivo pasando por la caché (ruta, mtime, tamaño)"""
+    estado = os.stat(ruta)
+    return _leer_cacheado(ruta, estado.st_mtime_ns, estado.st_size)
+
+
+# Plantillas de _iterar_reporte_completo (una sola llamada a format por bloque)
+_PLANTILLA_CABECERA_REPORTE = (
+    "# 📋 Reporte Completo de Validación IaC\n\n"
+    "**Módulo:** {modulo}\n"
+    "**Fecha:** {timestamp}\n"
+    "**Versión:** {version_reglas}\n\n"
+)
+
+_PLANTILLA_RESUMEN_REPORTE = (
+    "## 📊 Resumen General\n\n"
+    "- **Total de validaciones:** {total}\n"
+    "- **Validaciones exitosas:** {exitosas}\n"
+    "- **Validaciones fallidas:** {fallidas}\n"
+    "- **Porcentaje de éxito:** {porcentaje:.1f}%\n\n"
+)
+
+
+def _seccion(encabezado: str, elementos: Optional[Iterable[Any]]) -> str:
+    """Sección markdown con viñetas; cadena vacía si no hay elementos"""
+    if not elementos:
+        return ""
+    return f"### {encabezado}:\n" + "".join(f"- {elemento}\n" for elemento in elementos) + "\n"
+
+
+# Herramientas MCP que leen archivos y aplican una regla de contenido:
+# nombre -> (argumentos con las rutas, en el orden del método; método del manager; título del resultado)
+_HERRAMIENTAS_VALIDACION: Dict[str, Tuple[Tuple[str, ...], str, str]] = {
+    "validar_variables_obligatorias": (("ruta_variables",), "validar_variables_obligatorias", "Validación de Variables Obligatorias"),
+    "validar_tipos_datos": (("ruta_variables",), "validar_tipos_datos_inteligentes", "Validación de Tipos de Datos"),
+    "validar_for_each": (("ruta_main",), "validar_for_each_obligatorio", "Validación de for_each"),
+    "validar_cifrado_obligatorio": (("ruta_variables", "ruta_main"), "validar_cifrado_obligatorio", "Validación de Cifrado Obligatorio"),
+    "validar_acceso_publico": (("ruta_variables", "ruta_main"), "validar_acceso_publico_bloqueado", "Validación de Acceso Público"),
+    "validar_readme_estructura": (("ruta_readme",), "validar_readme_estructura_completa", "Validación de Estructura README"),
+    "validar_changelog": (("ruta_changelog",), "validar_changelog_formato_completo", "Validación de CHANGELOG"),
+}
+
+
+def _ejecutar_si_continua(detener: threading.Event, funcion_validacion: Callable[[str], Any], ruta: str) -> Any:
+    """Tarea del reporte completo: no valida si ya se pidió detener (fail_fast)"""
+    if detener.is_set():
+        return None
+    return funcion_validacion(ruta)
+
+
+# Manager propio de cada proceso worker (se crea en la primera tarea que recibe)
+_manager_proceso: Optional["ReglasIaCManager"] = None
+
+
+def _ejecutar_validacion_contenido(metodo: str, contenidos: Tuple[str, ...]) -> Dict[str, Any]:
+    """Worker de validar_modulo: aplica una regla de contenido en el proceso actual"""
+    global _manager_proceso
+    if _manager_proceso is None:
+        _manager_proceso = ReglasIaCManager()
+    # como_dict(): entre procesos viaja un dict plano, que es además lo que guarda el reporte
+    return como_dict(getattr(_manager_proceso, metodo)(*contenidos))
 
-from .reglas_basicas import ReglasBasicas
-from .reglas_avanzadas import ReglasAvanzadas
-from .reglas_seguridad import ReglasSeguridad
-from .reglas_documentacion import ReglasDocumentacion
 
 class ReglasIaCManager:
     """Manager principal que orquesta todas las reglas IaC"""
     
     def __init__(self):
-        # Instanciar todas las categorías de reglas
-        self.reglas_basicas = ReglasBasicas()
-        self.reglas_avanzadas = ReglasAvanzadas()
-        self.reglas_seguridad = ReglasSeguridad()
-        self.reglas_documentacion = ReglasDocumentacion()
+        # Las categorías de reglas se instancian (e importan) en su primer uso
         
         # Metadatos del manager
-        self.version = "2.0.0"
-        self.categorias_reglas = ["básicas", "avanzadas", "seguridad", "documentación"]
+        self.version = _VERSION_REGLAS
+        self.categorias_reglas = list(_CATEGORIAS_REGLAS)
+        
+        # Tabla de despacho de ejecutar_herramienta (nombre de herramienta MCP -> manejador)
+        self._manejadores: Dict[str, Callable[[Dict[str, Any]], str]] = {
+            nombre: partial(self._herramienta_validacion_archivos, claves_rutas=claves_rutas, metodo=metodo, titulo=titulo)
+            for nombre, (claves_rutas, metodo, titulo) in _HERRAMIENTAS_VALIDACION.items()
+        }
+        self._manejadores.update({
+            "validar_estructura_modulo": self._herramienta_estructura_modulo,
+            "generar_plantilla_readme": self._herramienta_plantilla_readme,
+            "generar_plantilla_changelog": self._herramienta_plantilla_changelog,
+            "generar_config_terraform_docs": self._herramienta_config_terraform_docs,
+            "obtener_estadisticas_reglas": self._herramienta_estadisticas_reglas,
+            "generar_reporte_completo": self._herramienta_reporte_completo
+        })
+
+    # ========== CATEGORÍAS DE REGLAS (CARGA PEREZOSA) ==========
+    
+    @cached_property
+    def reglas_basicas(self) -> "ReglasBasicas":
+        """Reglas básicas B1-B5, creadas en el primer acceso"""
+        from .reglas_basicas import ReglasBasicas
+        return ReglasBasicas()
+    
+    @cached_property
+    def reglas_avanzadas(self) -> "ReglasAvanzadas":
+        """Reglas avanzadas A1-A7, creadas en el primer acceso"""
+        from .reglas_avanzadas import ReglasAvanzadas
+        return ReglasAvanzadas()
+    
+    @cached_property
+    def reglas_seguridad(self) -> "ReglasSeguridad":
+        """Reglas de seguridad S1-S6, creadas en el primer acceso"""
+        from .reglas_seguridad import ReglasSeguridad
+        return ReglasSeguridad()
+    
+    @cached_property
+    def reglas_documentacion(self) -> "ReglasDocumentacion":
+        """Reglas de documentación D1-D7, creadas en el primer acceso"""
+        from .reglas_documentacion import ReglasDocumentacion
+        return ReglasDocumentacion()
 
     # ========== MÉTODOS DE REGLAS BÁSICAS ==========
     
-    def validar_estructura_modulo_completa(self, ruta_modulo: str) -> Dict[str, Any]:
+    def validar_estructura_modulo_completa(self, ruta_modulo: str) -> ResultadoValidacion:
         """Delegar a reglas básicas"""
         return self.reglas_basicas.validar_estructura_modulo_completa(ruta_modulo)
     
-    def validar_convenciones_nomenclatura(self, contenido_locals: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_estructura_lote(self, raices: Iterable[str]) -> Dict[str, ResultadoValidacion]:
+        """Delegar a reglas básicas"""
+        return self.reglas_basicas.validar_estructura_lote(raices)
+    
+    def validar_convenciones_nomenclatura(self, contenido_locals: str, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas básicas"""
         return self.reglas_basicas.validar_convenciones_nomenclatura(contenido_locals, contenido_main)
     
-    def validar_variables_obligatorias(self, contenido_variables: str) -> Dict[str, Any]:
+    def validar_variables_obligatorias(self, contenido_variables: str) -> ResultadoValidacion:
         """Delegar a reglas básicas"""
         return self.reglas_basicas.validar_variables_obligatorias(contenido_variables)
     
-    def validar_sistema_etiquetado(self, contenido_providers: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_sistema_etiquetado(self, contenido_providers: str, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas básicas"""
         return self.reglas_basicas.validar_sistema_etiquetado(contenido_providers, contenido_main)
     
-    def validar_sample_funcional(self, ruta_sample: str) -> Dict[str, Any]:
+    def validar_sample_funcional(self, ruta_sample: str) -> ResultadoValidacion:
         """Delegar a reglas básicas"""
         return self.reglas_basicas.validar_sample_funcional(ruta_sample)
 
     # ========== MÉTODOS DE REGLAS AVANZADAS ==========
     
-    def validar_tipos_datos_inteligentes(self, contenido_variables: str) -> Dict[str, Any]:
+    def validar_tipos_datos_inteligentes(self, contenido_variables: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_tipos_datos_inteligentes(contenido_variables)
     
-    def validar_for_each_obligatorio(self, contenido_main: str) -> Dict[str, Any]:
+    def validar_for_each_obligatorio(self, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_for_each_obligatorio(contenido_main)
     
-    def validar_validaciones_variables(self, contenido_variables: str) -> Dict[str, Any]:
+    def validar_validaciones_variables(self, contenido_variables: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_validaciones_variables(contenido_variables)
     
-    def validar_transformaciones_simples_locals(self, contenido_locals: str) -> Dict[str, Any]:
+    def validar_transformaciones_simples_locals(self, contenido_locals: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_transformaciones_simples_locals(contenido_locals)
     
-    def validar_outputs_descriptivos(self, contenido_outputs: str) -> Dict[str, Any]:
+    def validar_outputs_descriptivos(self, contenido_outputs: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_outputs_descriptivos(contenido_outputs)
     
-    def validar_provider_configuracion(self, contenido_providers: str) -> Dict[str, Any]:
+    def validar_provider_configuracion(self, contenido_providers: str) -> ResultadoValidacion:
         """Delegar a reglas avanzadas"""
         return self.reglas_avanzadas.validar_provider_configuracion(contenido_providers)
 
     # ========== MÉTODOS DE REGLAS SEGURIDAD ==========
     
-    def validar_cifrado_obligatorio(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_cifrado_obligatorio(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_cifrado_obligatorio(contenido_variables, contenido_main)
     
-    def validar_acceso_publico_bloqueado(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_acceso_publico_bloqueado(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_acceso_publico_bloqueado(contenido_variables, contenido_main)
     
-    def validar_force_ssl_tls(self, contenido_main: str, contenido_data: str) -> Dict[str, Any]:
+    def validar_force_ssl_tls(self, contenido_main: str, contenido_data: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_force_ssl_tls(contenido_main, contenido_data)
     
-    def validar_politicas_menor_privilegio(self, contenido_variables: str, contenido_data: str) -> Dict[str, Any]:
+    def validar_politicas_menor_privilegio(self, contenido_variables: str, contenido_data: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_politicas_menor_privilegio(contenido_variables, contenido_data)
     
-    def validar_logging_monitoreo(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    def validar_logging_monitoreo(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_logging_monitoreo(contenido_variables, contenido_main)
     
-    def validar_configuracion_redes(self, contenido_main: str) -> Dict[str, Any]:
+    def validar_configuracion_redes(self, contenido_main: str) -> ResultadoValidacion:
         """Delegar a reglas de seguridad"""
         return self.reglas_seguridad.validar_configuracion_redes(contenido_main)
 
     # ========== MÉTODOS DE REGLAS DOCUMENTACIÓN ==========
     
-    def validar_readme_estructura_completa(self, contenido_readme: str) -> Dict[str, Any]:
+    def validar_readme_estructura_completa(self, contenido_readme: str) -> ResultadoValidacion:
         """Delegar a reglas de documentación"""
         return self.reglas_documentacion.validar_readme_estructura_completa(contenido_readme)
     
-    def validar_changelog_formato_completo(self, contenido_changelog: str) -> Dict[str, Any]:
+    def readme_valido_rapido(self, contenido_readme: str) -> bool:
+        """Delegar a reglas de documentación"""
+        return self.reglas_documentacion.readme_valido_rapido(contenido_readme)
+    
+    def validar_changelog_formato_completo(self, contenido_changelog: str) -> ResultadoValidacion:
         """Delegar a reglas de documentación"""
         return self.reglas_documentacion.validar_changelog_formato_completo(contenido_changelog)
     
-    def validar_sample_readme(self, contenido_sample_readme: str) -> Dict[str, Any]:
+    def validar_sample_readme(self, contenido_sample_readme: str) -> ResultadoValidacion:
         """Delegar a reglas de documentación"""
         return self.reglas_documentacion.validar_sample_readme(contenido_sample_readme)
     
-    def validar_terraform_docs_configuracion(self, ruta_modulo: str) -> Dict[str, Any]:
+    def validar_terraform_docs_configuracion(self, ruta_modulo: str) -> ResultadoValidacion:
         """Delegar a reglas de documentación"""
         return self.reglas_documentacion.validar_terraform_docs_configuracion(ruta_modulo)
     
-    def validar_descriptions_obligatorios(self, contenido_variables: str, contenido_outputs: str) -> Dict[str, Any]:
+    def validar_descriptions_obligatorios(self, contenido_variables: str, contenido_outputs: str) -> ResultadoValidacion:
         """Delegar a reglas de documentación"""
         return self.reglas_documentacion.validar_descriptions_obligatorios(contenido_variables, contenido_outputs)
 
@@ -142,11 +345,16 @@ class ReglasIaCManager:
 
     # ========== MÉTODOS DE ORQUESTACIÓN ==========
     
-    def generar_reporte_validacion_completo(self, ruta_modulo: str) -> Dict[str, Any]:
-        """Generar reporte completo aplicando todas las categorías de reglas"""
+    def generar_reporte_validacion_completo(self, ruta_modulo: str, timestamp: Optional[str] = None, fail_fast: bool = False) -> Dict[str, Any]:
+        """Generar reporte completo aplicando todas las categorías de reglas
+
+        Con fail_fast=True el reporte se cierra en la primera validación inválida
+        (en el orden de la lista): las validaciones pendientes se cancelan y no
+        aparecen en el reporte, que queda con validacion_exitosa=False.
+        """
         reporte = {
             "modulo": ruta_modulo,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.datetime.now().isoformat(),
             "version_reglas": self.version,
             "validaciones": {},
             "resumen": {
@@ -160,83 +368,162 @@ class ReglasIaCManager:
         
         # Validaciones que no requieren contenido de archivos (solo estructura)
         validaciones_estructura = [
-            ("estructura_modulo", self.validar_estructura_modulo_completa, "básicas"),
-            ("terraform_docs_config", self.validar_terraform_docs_configuracion, "documentación")
+            ("estructura_modulo", self.validar_estructura_modulo_completa, _CATEGORIA_BASICAS),
+            ("terraform_docs_config", self.validar_terraform_docs_configuracion, _CATEGORIA_DOCUMENTACION)
         ]
         
-        for nombre, funcion_validacion, categoria in validaciones_estructura:
-            try:
-                resultado = funcion_validacion(ruta_modulo)
-                reporte["validaciones"][nombre] = resultado
-                reporte["resumen"]["total_errores"] += len(resultado.get("errores", []))
-                reporte["resumen"]["total_advertencias"] += len(resultado.get("advertencias", []))
-                reporte["resumen"]["reglas_aplicadas"].append(nombre)
-                
-                if categoria not in reporte["resumen"]["categorias_evaluadas"]:
-                    reporte["resumen"]["categorias_evaluadas"].append(categoria)
+        # Son independientes y sólo hacen E/S sobre la ruta: se lanzan en hilos a la vez
+        detener = threading.Event()
+        with ThreadPoolExecutor(max_workers=len(validaciones_estructura)) as executor:
+            tareas = [
+                (nombre, categoria, executor.submit(_ejecutar_si_continua, detener, funcion_validacion, ruta_modulo))
+                for nombre, funcion_validacion, categoria in validaciones_estructura
+            ]
+            # El resumen se acumula en este hilo, en el orden de la lista (reporte determinista)
+            for nombre, categoria, futuro in tareas:
+                try:
+                    self._registrar_resultado(reporte, nombre, categoria, futuro.result())
+                except Exception as e:
+                    self._registrar_fallo(reporte, nombre, categoria, f"Error ejecutando validación: {str(e)}")
                 
-                if not resultado.get("valido", True):
-                    reporte["resumen"]["validacion_exitosa"] = False
-                    
+                if fail_fast and not reporte["resumen"]["validacion_exitosa"]:
+                    # Las tareas en cola se cancelan; las que ya arrancaron ven el evento y no validan
+                    detener.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        
+        self._cerrar_resumen(reporte)
+        return reporte
+
+    def generar_reportes_lote(self, rutas_modulos: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Generar el reporte completo de varios módulos con una sola marca de tiempo para todo el lote"""
+        timestamp = datetime.datetime.now().isoformat()
+        return {ruta: self.generar_reporte_validacion_completo(ruta, timestamp) for ruta in rutas_modulos}
+
+    def validar_modulo(self, ruta_modulo: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Aplicar todas las reglas a un módulo repartiendo las de contenido en un pool de procesos"""
+        timestamp = datetime.datetime.now().isoformat()
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            tareas = self._lanzar_validaciones_contenido(executor, ruta_modulo)
+            return self._completar_reporte_modulo(ruta_modulo, timestamp, tareas)
+
+    def validar_modulos(self, rutas_modulos: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Aplicar todas las reglas a varios módulos con un único pool de procesos
+
+        Todas las parejas (módulo, regla de contenido) se encolan antes de recoger
+        ninguna, así el pool se arranca una vez y no se vacía entre módulos.
+        """
+        timestamp = datetime.datetime.now().isoformat()
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            tareas_por_modulo = {
+                ruta: self._lanzar_validaciones_contenido(executor, ruta)
+                for ruta in dict.fromkeys(rutas_modulos)
+            }
+            return {
+                ruta: self._completar_reporte_modulo(ruta, timestamp, tareas)
+                for ruta, tareas in tareas_por_modulo.items()
+            }
+
+    def _lanzar_validaciones_contenido(self, executor: ProcessPoolExecutor, ruta_modulo: str) -> List[Tuple[str, str, Any, Optional[List[str]]]]:
+        """Leer los archivos del módulo y encolar sus reglas de contenido: [(nombre, categoría, futuro, errores de lectura)]"""
+        # Cada archivo se lee una sola vez aunque lo consuman varias reglas
+        contenidos: Dict[str, str] = {}
+        errores_lectura: Dict[str, str] = {}
+        for archivo in dict.fromkeys(archivo for *_, archivos in _VALIDACIONES_CONTENIDO for archivo in archivos):
+            try:
+                contenidos[archivo] = _leer_archivo(os.path.join(ruta_modulo, archivo))
             except Exception as e:
-                reporte["validaciones"][nombre] = {
-                    "valido": False,
-                    "errores": [f"Error ejecutando validación: {str(e)}"],
-                    "categoria": categoria
-                }
-                reporte["resumen"]["validacion_exitosa"] = False
+                errores_lectura[archivo] = f"❌ Error leyendo archivo {archivo}: {str(e)}"
         
-        # Agregar resumen por categorías
-        reporte["resumen"]["total_categorias"] = len(self.categorias_reglas)
-        reporte["resumen"]["categorias_evaluadas_count"] = len(reporte["resumen"]["categorias_evaluadas"])
+        tareas = []
+        for nombre, categoria, metodo, archivos in _VALIDACIONES_CONTENIDO:
+            faltantes = [errores_lectura[archivo] for archivo in archivos if archivo in errores_lectura]
+            if faltantes:
+                tareas.append((nombre, categoria, None, faltantes))
+                continue
+            futuro = executor.submit(_ejecutar_validacion_contenido, metodo, tuple(contenidos[archivo] for archivo in archivos))
+            tareas.append((nombre, categoria, futuro, None))
+        return tareas
+
+    def _completar_reporte_modulo(self, ruta_modulo: str, timestamp: str, tareas: List[Tuple[str, str, Any, Optional[List[str]]]]) -> Dict[str, Any]:
+        """Reporte de validar_modulo: validaciones de rutas en este proceso y luego las reglas de contenido encoladas"""
+        reporte = {
+            "modulo": ruta_modulo,
+            "timestamp": timestamp,
+            "version_reglas": self.version,
+            "validaciones": {},
+            "resumen": {
+                "total_errores": 0,
+                "total_advertencias": 0,
+                "validacion_exitosa": True,
+                "reglas_aplicadas": [],
+                "categorias_evaluadas": []
+            }
+        }
         
+        # Validaciones de rutas: sólo listan directorios, se ejecutan en el proceso actual
+        # mientras el pool procesa las de contenido
+        validaciones_estructura = [
+            ("estructura_modulo", self.validar_estructura_modulo_completa, ruta_modulo, _CATEGORIA_BASICAS),
+            ("sample_funcional", self.validar_sample_funcional, os.path.join(ruta_modulo, "sample"), _CATEGORIA_BASICAS),
+            ("terraform_docs_config", self.validar_terraform_docs_configuracion, ruta_modulo, _CATEGORIA_DOCUMENTACION)
+        ]
+        
+        for nombre, funcion_validacion, ruta, categoria in validaciones_estructura:
+            try:
+                self._registrar_resultado(reporte, nombre, categoria, funcion_validacion(ruta))
+            except Exception as e:
+                self._registrar_fallo(reporte, nombre, categoria, f"Error ejecutando validación: {str(e)}")
+        
+        # Recolectar en el orden de la tabla para que el reporte sea determinista
+        for nombre, categoria, futuro, faltantes in tareas:
+            if futuro is None:
+                self._registrar_fallo(reporte, nombre, categoria, *faltantes)
+                continue
+            try:
+                self._registrar_resultado(reporte, nombre, categoria, futuro.result())
+            except Exception as e:
+                self._registrar_fallo(reporte, nombre, categoria, f"Error ejecutando validación: {str(e)}")
+        
+        self._cerrar_resumen(reporte)
         return reporte
 
-    def obtener_estadisticas_reglas(self) -> Dict[str, Any]:
-        """Obtener estadísticas sobre las reglas disponibles"""
-        return {
-            "version": self.version,
-            "categorias_disponibles": self.categorias_reglas,
-            "total_categorias": len(self.categorias_reglas),
-            "reglas_por_categoria": {
-                "básicas": [
-                    "validar_estructura_modulo_completa",
-                    "validar_convenciones_nomenclatura", 
-                    "validar_variables_obligatorias",
-                    "validar_sistema_etiquetado",
-                    "validar_sample_funcional"
-                ],
-                "avanzadas": [
-                    "validar_tipos_datos_inteligentes",
-                    "validar_for_each_obligatorio",
-                    "validar_validaciones_variables",
-                    "validar_transformaciones_simples_locals",
-                    "validar_outputs_descriptivos",
-                    "validar_provider_configuracion"
-                ],
-                "seguridad": [
-                    "validar_cifrado_obligatorio",
-                    "validar_acceso_publico_bloqueado",
-                    "validar_force_ssl_tls",
-                    "validar_politicas_menor_privilegio",
-                    "validar_logging_monitoreo",
-                    "validar_configuracion_redes"
-                ],
-                "documentación": [
-                    "validar_readme_estructura_completa",
-                    "validar_changelog_formato_completo",
-                    "validar_sample_readme",
-                    "validar_terraform_docs_configuracion",
-                    "validar_descriptions_obligatorios"
-                ]
-            },
-            "herramientas_generacion": [
-                "obtener_plantilla_readme_completa",
-                "obtener_plantilla_changelog_completa",
-                "obtener_configuracion_terraform_docs",
-                "obtener_plantilla_sample_readme"
-            ]
+    def _registrar_resultado(self, reporte: Dict[str, Any], nombre: str, categoria: str, resultado: Union[Mapping[str, Any], ResultadoValidacion]) -> None:
+        """Agregar el resultado de una validación al reporte y acumular el resumen"""
+        resumen = reporte["resumen"]
+        # El reporte guarda dicts planos para que siga siendo serializable tal cual;
+        # todas las reglas devuelven valido/errores/advertencias, así que se indexan directamente
+        registro = como_dict(resultado)
+        reporte["validaciones"][nombre] = registro
+        resumen["total_errores"] += len(registro["errores"])
+        resumen["total_advertencias"] += len(registro["advertencias"])
+        resumen["reglas_aplicadas"].append(nombre)
+        # Se acumula con repeticiones; _cerrar_resumen las quita en una sola pasada
+        resumen["categorias_evaluadas"].append(categoria)
+        
+        if not registro["valido"]:
+            resumen["validacion_exitosa"] = False
+    
+    def _cerrar_resumen(self, reporte: Dict[str, Any]) -> None:
+        """Deduplicar las categorías evaluadas (conservando el orden) y agregar el resumen por categorías"""
+        resumen = reporte["resumen"]
+        resumen["categorias_evaluadas"] = list(dict.fromkeys(resumen["categorias_evaluadas"]))
+        resumen["total_categorias"] = len(self.categorias_reglas)
+        resumen["categorias_evaluadas_count"] = len(resumen["categorias_evaluadas"])
+
+    def _registrar_fallo(self, reporte: Dict[str, Any], nombre: str, categoria: str, *errores: str) -> None:
+        """Registrar una validación que no pudo ejecutarse"""
+        reporte["validaciones"][nombre] = {
+            "valido": False,
+            "errores": list(errores),
+            "categoria": categoria
         }
+        reporte["resumen"]["validacion_exitosa"] = False
+
+    def obtener_estadisticas_reglas(self) -> Mapping[str, Any]:
+        """Obtener estadísticas sobre las reglas disponibles"""
+        # Constante de sólo lectura compartida; quien necesite modificarla debe copiarla
+        return _ESTADISTICAS_REGLAS
 
     def validar_categoria_completa(self, categoria: str, archivos_modulo: Dict[str, str]) -> Dict[str, Any]:
         """Validar una categoría completa de reglas con archivos proporcionados"""
@@ -264,183 +551,147 @@ class ReglasIaCManager:
 
     def ejecutar_herramienta(self, nombre_herramienta: str, argumentos: Dict[str, Any]) -> str:
         """Ejecuta una herramienta específica basada en su nombre"""
-        
-        # ========== REGLAS BÁSICAS ==========
-        if nombre_herramienta == "validar_estructura_modulo":
-            ruta_modulo = argumentos.get("ruta_modulo")
-            resultado = self.validar_estructura_modulo_completa(ruta_modulo)
-            return self._formatear_resultado_validacion(resultado, "Validación de Estructura del Módulo")
-            
-        elif nombre_herramienta == "validar_variables_obligatorias":
-            ruta_variables = argumentos.get("ruta_variables")
-            try:
-                with open(ruta_variables, 'r', encoding='utf-8') as f:
-                    contenido = f.read()
-                resultado = self.validar_variables_obligatorias(contenido)
-                return self._formatear_resultado_validacion(resultado, "Validación de Variables Obligatorias")
-            except Exception as e:
-                return f"❌ Error leyendo archivo {ruta_variables}: {str(e)}"
-        
-        # ========== REGLAS AVANZADAS ==========
-        elif nombre_herramienta == "validar_tipos_datos":
-            ruta_variables = argumentos.get("ruta_variables")
-            try:
-                with open(ruta_variables, 'r', encoding='utf-8') as f:
-                    contenido = f.read()
-                resultado = self.validar_tipos_datos_inteligentes(contenido)
-                return self._formatear_resultado_validacion(resultado, "Validación de Tipos de Datos")
-            except Exception as e:
-                return f"❌ Error leyendo archivo {ruta_variables}: {str(e)}"
-                
-        elif nombre_herramienta == "validar_for_each":
-            ruta_main = argumentos.get("ruta_main")
-            try:
-                with open(ruta_main, 'r', encoding='utf-8') as f:
-                    contenido = f.read()
-                resultado = self.validar_for_each_obligatorio(contenido)
-                return self._formatear_resultado_validacion(resultado, "Validación de for_each")
-            except Exception as e:
-                return f"❌ Error leyendo archivo {ruta_main}: {str(e)}"
-        
-        # ========== REGLAS DE SEGURIDAD ==========
-        elif nombre_herramienta == "validar_cifrado_obligatorio":
-            ruta_variables = argumentos.get("ruta_variables")
-            ruta_main = argumentos.get("ruta_main")
-            try:
-                with open(ruta_variables, 'r', encoding='utf-8') as f:
-                    contenido_variables = f.read()
-                with open(ruta_main, 'r', encoding='utf-8') as f:
-                    contenido_main = f.read()
-                resultado = self.validar_cifrado_obligatorio(contenido_variables, contenido_main)
-                return self._formatear_resultado_validacion(resultado, "Validación de Cifrado Obligatorio")
-            except Exception as e:
-                return f"❌ Error leyendo archivos: {str(e)}"
-                
-        elif nombre_herramienta == "validar_acceso_publico":
-            ruta_variables = argumentos.get("ruta_variables")
-            ruta_main = argumentos.get("ruta_main")
-            try:
-                with open(ruta_variables, 'r', encoding='utf-8') as f:
-                    contenido_variables = f.read()
-                with open(ruta_main, 'r', encoding='utf-8') as f:
-                    contenido_main = f.read()
-                resultado = self.validar_acceso_publico_bloqueado(contenido_variables, contenido_main)
-                return self._formatear_resultado_validacion(resultado, "Validación de Acceso Público")
-            except Exception as e:
-                return f"❌ Error leyendo archivos: {str(e)}"
-        
-        # ========== REGLAS DE DOCUMENTACIÓN ==========
-        elif nombre_herramienta == "validar_readme_estructura":
-            ruta_readme = argumentos.get("ruta_readme")
-            try:
-                with open(ruta_readme, 'r', encoding='utf-8') as f:
-                    contenido = f.read()
-                resultado = self.validar_readme_estructura_completa(contenido)
-                return self._formatear_resultado_validacion(resultado, "Validación de Estructura README")
-            except Exception as e:
-                return f"❌ Error leyendo archivo {ruta_readme}: {str(e)}"
-                
-        elif nombre_herramienta == "validar_changelog":
-            ruta_changelog = argumentos.get("ruta_changelog")
-            try:
-                with open(ruta_changelog, 'r', encoding='utf-8') as f:
-                    contenido = f.read()
-                resultado = self.validar_changelog_formato_completo(contenido)
-                return self._formatear_resultado_validacion(resultado, "Validación de CHANGELOG")
-            except Exception as e:
-                return f"❌ Error leyendo archivo {ruta_changelog}: {str(e)}"
-        
-        # ========== HERRAMIENTAS DE GENERACIÓN ==========
-        elif nombre_herramienta == "generar_plantilla_readme":
-            nombre_modulo = argumentos.get("nombre_modulo")
-            tipo_recurso = argumentos.get("tipo_recurso", "recurso")
-            plantilla = self.obtener_plantilla_readme_completa(nombre_modulo, tipo_recurso)
-            return f"📄 **Plantilla README.md generada para {nombre_modulo}**\n\n```markdown\n{plantilla}\n```"
-            
-        elif nombre_herramienta == "generar_plantilla_changelog":
-            plantilla = self.obtener_plantilla_changelog_completa()
-            return f"📄 **Plantilla CHANGELOG.md generada**\n\n```markdown\n{plantilla}\n```"
-            
-        elif nombre_herramienta == "generar_config_terraform_docs":
-            config = self.obtener_configuracion_terraform_docs()
-            return f"⚙️ **Configuración .terraform-docs.yml generada**\n\n```yaml\n{config}\n```"
-        
-        # ========== HERRAMIENTAS DE INFORMACIÓN ==========
-        elif nombre_herramienta == "obtener_estadisticas_reglas":
-            estadisticas = self.obtener_estadisticas_reglas()
-            return self._formatear_estadisticas(estadisticas)
-            
-        elif nombre_herramienta == "generar_reporte_completo":
-            ruta_modulo = argumentos.get("ruta_modulo")
-            reporte = self.generar_reporte_validacion_completo(ruta_modulo)
-            return self._formatear_reporte_completo(reporte)
-        
-        else:
+        manejador = self._manejadores.get(nombre_herramienta)
+        if manejador is None:
             raise Exception(f"Herramienta no implementada: {nombre_herramienta}")
+        return manejador(argumentos)
+
+    # ========== MANEJADORES DE HERRAMIENTAS: VALIDACIÓN ==========
+    
+    def _herramienta_estructura_modulo(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta validar_estructura_modulo"""
+        ruta_modulo = argumentos.get("ruta_modulo")
+        resultado = self.validar_estructura_modulo_completa(ruta_modulo)
+        return self._formatear_resultado_validacion(resultado, "Validación de Estructura del Módulo")
+    
+    def _herramienta_validacion_archivos(self, argumentos: Dict[str, Any], claves_rutas: Tuple[str, ...], metodo: str, titulo: str) -> str:
+        """Herramientas de _HERRAMIENTAS_VALIDACION: leer los archivos indicados, validar y formatear"""
+        leido, contenidos = self._leer_varios([argumentos.get(clave) for clave in claves_rutas])
+        if not leido:
+            return contenidos[0]
+        resultado = getattr(self, metodo)(*contenidos)
+        return self._formatear_resultado_validacion(resultado, titulo)
+
+    # ========== MANEJADORES DE HERRAMIENTAS: GENERACIÓN ==========
+    
+    def _herramienta_plantilla_readme(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta generar_plantilla_readme"""
+        nombre_modulo = argumentos.get("nombre_modulo")
+        tipo_recurso = argumentos.get("tipo_recurso", "recurso")
+        plantilla = self.obtener_plantilla_readme_completa(nombre_modulo, tipo_recurso)
+        return f"📄 **Plantilla README.md generada para {nombre_modulo}**\n\n```markdown\n{plantilla}\n```"
+    
+    def _herramienta_plantilla_changelog(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta generar_plantilla_changelog"""
+        plantilla = self.obtener_plantilla_changelog_completa()
+        return f"📄 **Plantilla CHANGELOG.md generada**\n\n```markdown\n{plantilla}\n```"
+    
+    def _herramienta_config_terraform_docs(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta generar_config_terraform_docs"""
+        config = self.obtener_configuracion_terraform_docs()
+        return f"⚙️ **Configuración .terraform-docs.yml generada**\n\n```yaml\n{config}\n```"
+
+    # ========== MANEJADORES DE HERRAMIENTAS: INFORMACIÓN ==========
     
-    def _formatear_resultado_validacion(self, resultado: Dict[str, Any], titulo: str) -> str:
+    def _herramienta_estadisticas_reglas(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta obtener_estadisticas_reglas"""
+        estadisticas = self.obtener_estadisticas_reglas()
+        return self._formatear_estadisticas(estadisticas)
+    
+    def _herramienta_reporte_completo(self, argumentos: Dict[str, Any]) -> str:
+        """Herramienta generar_reporte_completo"""
+        ruta_modulo = argumentos.get("ruta_modulo")
+        reporte = self.generar_reporte_validacion_completo(ruta_modulo)
+        return self._formatear_reporte_completo(reporte)
+    
+    def _archivo_requerido(self, ruta: Optional[str]) -> Optional[str]:
+        """Mensaje de error si la ruta no es un archivo existente, None si se puede leer"""
+        if not ruta or not os.path.isfile(ruta):
+            return f"❌ Archivo no encontrado: {ruta}"
+        return None
+    
+    def _leer_seguro(self, ruta: str) -> Tuple[bool, str]:
+        """Leer un archivo para una herramienta: (True, contenido) o (False, mensaje de error)"""
+        # Caso habitual de error (ruta mal escrita o ausente) resuelto con un stat, sin excepción
+        error = self._archivo_requerido(ruta)
+        if error is not None:
+            return False, error
+        try:
+            return True, _leer_archivo(ruta)
+        except Exception as e:
+            return False, f"❌ Error leyendo archivo {ruta}: {str(e)}"
+    
+    def _leer_varios(self, rutas: Sequence[str]) -> Tuple[bool, List[str]]:
+        """Leer uno o varios archivos (un hilo por archivo si son varios): (True, contenidos) o (False, [primer error])"""
+        if len(rutas) == 1:
+            lecturas = [self._leer_seguro(rutas[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(rutas)) as executor:
+                lecturas = list(executor.map(self._leer_seguro, rutas))
+        for leido, contenido in lecturas:
+            if not leido:
+                return False, [contenido]
+        return True, [contenido for _, contenido in lecturas]
+    
+    def _formatear_resultado_validacion(self, resultado: Union[Mapping[str, Any], ResultadoValidacion], titulo: str) -> str:
         """Formatea el resultado de una validación para presentación"""
-        estado = "✅ VÁLIDO" if resultado.get("valido", False) else "❌ INVÁLIDO"
-        mensaje = resultado.get("mensaje", "Sin mensaje")
-        
-        output = f"## {titulo}\n\n**Estado:** {estado}\n\n**Resultado:** {mensaje}\n\n"
-        
-        if "errores" in resultado and resultado["errores"]:
-            output += "### ❌ Errores encontrados:\n"
-            for error in resultado["errores"]:
-                output += f"- {error}\n"
-            output += "\n"
+        if not isinstance(resultado, ResultadoValidacion):
+            resultado = ResultadoValidacion.desde_mapping(resultado)
+        estado = "✅ VÁLIDO" if resultado.valido else "❌ INVÁLIDO"
+        mensaje = resultado.extras.get("mensaje", "Sin mensaje")
         
-        if "advertencias" in resultado and resultado["advertencias"]:
-            output += "### ⚠️ Advertencias:\n"
-            for advertencia in resultado["advertencias"]:
-                output += f"- {advertencia}\n"
-            output += "\n"
-        
-        if "recomendaciones" in resultado and resultado["recomendaciones"]:
-            output += "### 💡 Recomendaciones:\n"
-            for recomendacion in resultado["recomendaciones"]:
-                output += f"- {recomendacion}\n"
-            output += "\n"
-        
-        return output
+        return "".join((
+            f"## {titulo}\n\n**Estado:** {estado}\n\n**Resultado:** {mensaje}\n\n",
+            _seccion("❌ Errores encontrados", resultado.errores),
+            _seccion("⚠️ Advertencias", resultado.advertencias),
+            _seccion("💡 Recomendaciones", resultado.extras.get("recomendaciones"))
+        ))
     
-    def _formatear_estadisticas(self, estadisticas: Dict[str, Any]) -> str:
+    def _formatear_estadisticas(self, estadisticas: Mapping[str, Any]) -> str:
         """Formatea las estadísticas de reglas"""
-        output = "## 📊 Estadísticas de Reglas IaC\n\n"
-        
-        output += f"**Versión:** {estadisticas['version']}\n"
-        output += f"**Total de reglas:** {estadisticas['total_reglas']}\n\n"
+        reglas_por_categoria = estadisticas["reglas_por_categoria"]
+        partes: List[str] = [
+            "## 📊 Estadísticas de Reglas IaC\n\n",
+            f"**Versión:** {estadisticas['version']}\n",
+            f"**Total de reglas:** {sum(len(reglas) for reglas in reglas_por_categoria.values())}\n\n"
+        ]
         
-        for categoria, info in estadisticas['categorias'].items():
-            output += f"### {categoria.title()}\n"
-            output += f"- **Cantidad:** {info['cantidad']}\n"
-            output += f"- **Reglas:** {', '.join(info['reglas'])}\n\n"
+        for categoria, reglas in reglas_por_categoria.items():
+            partes.append(f"### {categoria.title()}\n")
+            partes.append(f"- **Cantidad:** {len(reglas)}\n")
+            partes.append(f"- **Reglas:** {', '.join(reglas)}\n\n")
         
-        return output
+        return "".join(partes)
     
     def _formatear_reporte_completo(self, reporte: Dict[str, Any]) -> str:
         """Formatea el reporte completo de validación"""
-        output = f"# 📋 Reporte Completo de Validación IaC\n\n"
-        output += f"**Módulo:** {reporte['modulo']}\n"
-        output += f"**Fecha:** {reporte['fecha']}\n"
-        output += f"**Versión:** {reporte['version']}\n\n"
+        return "".join(self._iterar_reporte_completo(reporte))
+    
+    def _iterar_reporte_completo(self, reporte: Dict[str, Any]) -> Iterator[str]:
+        """Genera el reporte completo de validación por fragmentos (para volcarlo sin armarlo entero)"""
+        validaciones = reporte["validaciones"]
+        total = len(validaciones)
+        exitosas = sum(1 for resultado in validaciones.values() if resultado.get("valido", False))
         
-        # Resumen general
-        output += "## 📊 Resumen General\n\n"
-        resumen = reporte['resumen']
-        output += f"- **Total de validaciones:** {resumen['total_validaciones']}\n"
-        output += f"- **Validaciones exitosas:** {resumen['exitosas']}\n"
-        output += f"- **Validaciones fallidas:** {resumen['fallidas']}\n"
-        output += f"- **Porcentaje de éxito:** {resumen['porcentaje_exito']:.1f}%\n\n"
+        yield _PLANTILLA_CABECERA_REPORTE.format_map(reporte)
         
-        # Detalles por categoría
-        for categoria, resultados in reporte['resultados'].items():
-            if resultados:  # Solo mostrar categorías con resultados
-                output += f"## {categoria.title()}\n\n"
-                for nombre_validacion, resultado in resultados.items():
-                    estado = "✅" if resultado.get("valido", False) else "❌"
-                    output += f"### {estado} {nombre_validacion}\n"
-                    output += f"{resultado.get('mensaje', 'Sin mensaje')}\n\n"
+        # Resumen general
+        yield _PLANTILLA_RESUMEN_REPORTE.format(
+            total=total,
+            exitosas=exitosas,
+            fallidas=total - exitosas,
+            porcentaje=exitosas * 100 / total if total else 0.0
+        )
         
-        return output
+        # Detalle de cada validación aplicada
+        if validaciones:
+            yield "## Validaciones\n\n"
+            for nombre_validacion, resultado in validaciones.items():
+                estado = "✅" if resultado.get("valido", False) else "❌"
+                yield f"### {estado} {nombre_validacion}\n\n"
+                # Los registros del reporte son dicts planos con errores/advertencias (ver _registrar_resultado)
+                detalle = (
+                    _seccion("❌ Errores encontrados", resultado.get("errores"))
+                    + _seccion("⚠️ Advertencias", resultado.get("advertencias"))
+                )
+                yield detalle or "Sin errores ni advertencias\n\n"
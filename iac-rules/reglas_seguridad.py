@@ -5,7 +5,135 @@ Implementa configuraciones de seguridad obligatorias según Pragma CloudOps
 """
 
 import re
-from typing import Dict, Any, List
+from typing import Container, Final, List, Mapping, NamedTuple, Sequence, Tuple
+
+from .cache_resultados import memoizar_por_contenido
+from .escaneo_literales import EscanerLiterales
+from .mensajes import CodigoMensaje, Mensaje, mensaje
+from .resultados import ResultadoValidacion, construir_resultado
+
+# Patrones precompilados (se compilan una sola vez al importar el módulo)
+_RE_ENCRYPTION_DEFAULT_TRUE = re.compile(r'encryption_enabled\s*=\s*optional\([^,]*,\s*true\)')
+# "public" seguido de "true" en la misma línea (p. ej. publicly_accessible = true)
+_RE_PUBLICO_TRUE = re.compile(r'public[^\n]{0,80}true', re.IGNORECASE)
+
+# Literales que consume cada regla por archivo (una sola pasada por archivo y regla)
+_ESCANER_CIFRADO_MAIN = EscanerLiterales((
+    "aws_s3_bucket", "aws_s3_bucket_server_side_encryption_configuration",
+    "aws_rds", "storage_encrypted", "aws_kms_key", "enable_key_rotation"
+))
+_ESCANER_ACCESO_PUBLICO_MAIN = EscanerLiterales((
+    "aws_s3_bucket", "aws_s3_bucket_public_access_block", "aws_security_group", "0.0.0.0/0"
+))
+_ESCANER_SSL_MAIN = EscanerLiterales((
+    "aws_s3_bucket", "force_ssl", "http://", "ssl = false", "tls = false",
+    "aws_lb", "aws_elb", "HTTPS", "SSL"
+))
+_ESCANER_PRIVILEGIO_VARIABLES = EscanerLiterales(("policy_statements", "sid", "effect"))
+_ESCANER_PRIVILEGIO_DATA = EscanerLiterales((
+    "aws_iam_policy_document", 'dynamic "statement"', "*", "Action", '"*"', "Principal"
+))
+_ESCANER_LOGGING_VARIABLES = EscanerLiterales(("enable_logging", "enable_versioning"))
+_ESCANER_LOGGING_MAIN = EscanerLiterales((
+    "aws_s3_bucket", "aws_s3_bucket_versioning", "aws_s3_bucket_logging", "aws_cloudtrail",
+    "enable_logging", "aws_cloudwatch_log_group", "retention_in_days"
+))
+_ESCANER_REDES_MAIN = EscanerLiterales((
+    "aws_vpc", "enable_dns_hostnames", "enable_dns_support", "aws_subnet",
+    "map_public_ip_on_launch", "true", "aws_network_acl", "0.0.0.0/0"
+))
+
+
+# Mensajes de las comprobaciones que no van en tabla (sin argumentos: se crean una sola vez)
+_S1_SIN_ENCRYPTION_ENABLED: Final = mensaje(CodigoMensaje.S1_SIN_ENCRYPTION_ENABLED)
+_S1_ENCRYPTION_DEFAULT_FALSE: Final = mensaje(CodigoMensaje.S1_ENCRYPTION_DEFAULT_FALSE)
+_S2_SIN_BLOCK_PUBLIC_ACCESS: Final = mensaje(CodigoMensaje.S2_SIN_BLOCK_PUBLIC_ACCESS)
+_S2_CONFIGURACION_PUBLICA: Final = mensaje(CodigoMensaje.S2_CONFIGURACION_PUBLICA)
+_S3_S3_SIN_FORCE_SSL: Final = mensaje(CodigoMensaje.S3_S3_SIN_FORCE_SSL)
+_S4_SIN_POLICY_STATEMENTS: Final = mensaje(CodigoMensaje.S4_SIN_POLICY_STATEMENTS)
+_S4_STATEMENT_SIN_SID_EFFECT: Final = mensaje(CodigoMensaje.S4_STATEMENT_SIN_SID_EFFECT)
+
+
+class _Comprobacion(NamedTuple):
+    """Fila de la tabla de una regla: si los literales del archivo cumplen la condición se emite el mensaje"""
+    archivo: str
+    mensaje: Mensaje
+    requeridos: Tuple[str, ...] = ()   # deben aparecer todos
+    ausentes: Tuple[str, ...] = ()     # no debe aparecer ninguno
+    alguno: Tuple[str, ...] = ()       # si no está vacío, debe aparecer al menos uno
+    es_error: bool = False
+
+
+_TABLA_CIFRADO = (
+    _Comprobacion("main", mensaje(CodigoMensaje.S1_S3_SIN_CIFRADO),
+                  requeridos=("aws_s3_bucket",),
+                  ausentes=("aws_s3_bucket_server_side_encryption_configuration",), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S1_RDS_SIN_CIFRADO),
+                  requeridos=("aws_rds",), ausentes=("storage_encrypted",), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S1_KMS_SIN_ROTACION),
+                  requeridos=("aws_kms_key",), ausentes=("enable_key_rotation",)),
+)
+_TABLA_ACCESO_PUBLICO = (
+    _Comprobacion("main", mensaje(CodigoMensaje.S2_S3_SIN_PUBLIC_ACCESS_BLOCK),
+                  requeridos=("aws_s3_bucket",), ausentes=("aws_s3_bucket_public_access_block",), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S2_SECURITY_GROUP_ABIERTO),
+                  requeridos=("aws_security_group", "0.0.0.0/0")),
+)
+_TABLA_SSL = (
+    _Comprobacion("main", mensaje(CodigoMensaje.S3_HTTP_INSEGURO),
+                  requeridos=("http://",), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S3_SSL_DESHABILITADO),
+                  alguno=("ssl = false", "tls = false"), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S3_LB_SIN_HTTPS),
+                  alguno=("aws_lb", "aws_elb"), ausentes=("HTTPS", "SSL")),
+)
+_TABLA_PRIVILEGIO = (
+    _Comprobacion("data", mensaje(CodigoMensaje.S4_SIN_DYNAMIC_STATEMENTS),
+                  requeridos=("aws_iam_policy_document",), ausentes=('dynamic "statement"',)),
+    _Comprobacion("data", mensaje(CodigoMensaje.S4_ACCION_COMODIN),
+                  requeridos=("*", "Action")),
+    _Comprobacion("data", mensaje(CodigoMensaje.S4_PRINCIPAL_COMODIN),
+                  requeridos=('"*"', "Principal")),
+)
+_TABLA_LOGGING = (
+    _Comprobacion("variables", mensaje(CodigoMensaje.S5_SIN_ENABLE_LOGGING),
+                  ausentes=("enable_logging",)),
+    _Comprobacion("variables", mensaje(CodigoMensaje.S5_SIN_ENABLE_VERSIONING),
+                  ausentes=("enable_versioning",)),
+    _Comprobacion("main", mensaje(CodigoMensaje.S5_S3_SIN_VERSIONING),
+                  requeridos=("aws_s3_bucket",), ausentes=("aws_s3_bucket_versioning",)),
+    _Comprobacion("main", mensaje(CodigoMensaje.S5_S3_SIN_LOGGING),
+                  requeridos=("aws_s3_bucket",), ausentes=("aws_s3_bucket_logging",)),
+    _Comprobacion("main", mensaje(CodigoMensaje.S5_CLOUDTRAIL_SIN_LOGGING),
+                  requeridos=("aws_cloudtrail",), ausentes=("enable_logging",), es_error=True),
+    _Comprobacion("main", mensaje(CodigoMensaje.S5_LOG_GROUP_SIN_RETENCION),
+                  requeridos=("aws_cloudwatch_log_group",), ausentes=("retention_in_days",)),
+)
+_TABLA_REDES = (
+    _Comprobacion("main", mensaje(CodigoMensaje.S6_VPC_SIN_DNS_HOSTNAMES),
+                  requeridos=("aws_vpc",), ausentes=("enable_dns_hostnames",)),
+    _Comprobacion("main", mensaje(CodigoMensaje.S6_VPC_SIN_DNS_SUPPORT),
+                  requeridos=("aws_vpc",), ausentes=("enable_dns_support",)),
+    _Comprobacion("main", mensaje(CodigoMensaje.S6_SUBNET_IP_PUBLICA),
+                  requeridos=("aws_subnet", "map_public_ip_on_launch", "true")),
+    _Comprobacion("main", mensaje(CodigoMensaje.S6_NACL_PERMISIVA),
+                  requeridos=("aws_network_acl", "0.0.0.0/0")),
+)
+
+
+def _evaluar_tabla(tabla: Sequence[_Comprobacion], presentes: Mapping[str, Container[str]],
+                   errores: List[Mensaje], advertencias: List[Mensaje]) -> None:
+    """Recorrer la tabla de una regla sobre los literales presentes en cada archivo
+
+    Se consultan primero los recursos (requeridos/alguno) y sólo si están se miran los ausentes.
+    """
+    for archivo, mensaje_fila, requeridos, ausentes, alguno, es_error in tabla:
+        encontrados = presentes[archivo]
+        if (all(literal in encontrados for literal in requeridos)
+                and (not alguno or any(literal in encontrados for literal in alguno))
+                and not any(literal in encontrados for literal in ausentes)):
+            (errores if es_error else advertencias).append(mensaje_fila)
+
 
 class ReglasSeguridad:
     """Implementa las reglas de seguridad S1-S6 para módulos Terraform"""
@@ -19,189 +147,101 @@ class ReglasSeguridad:
             "enable_versioning": True
         }
 
-    def validar_cifrado_obligatorio(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_cifrado_obligatorio(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """REGLA S1: Validar que cifrado esté habilitado por defecto"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
         
         # Verificar que variables incluyan encryption_enabled
         if "encryption_enabled" not in contenido_variables:
-            errores.append("❌ Variables deben incluir 'encryption_enabled' con default true")
+            errores.append(_S1_SIN_ENCRYPTION_ENABLED)
         else:
             # Verificar que el default sea true
-            patron_encryption = r'encryption_enabled\s*=\s*optional\([^,]*,\s*true\)'
-            if not re.search(patron_encryption, contenido_variables):
-                errores.append("❌ 'encryption_enabled' debe tener default = true")
+            if not _RE_ENCRYPTION_DEFAULT_TRUE.search(contenido_variables):
+                errores.append(_S1_ENCRYPTION_DEFAULT_FALSE)
         
         # Verificar implementación de cifrado en recursos
-        if "aws_s3_bucket" in contenido_main:
-            if "aws_s3_bucket_server_side_encryption_configuration" not in contenido_main:
-                errores.append("❌ Buckets S3 deben tener configuración de cifrado server-side")
-        
-        if "aws_rds" in contenido_main:
-            if "storage_encrypted" not in contenido_main:
-                errores.append("❌ Instancias RDS deben tener storage_encrypted = true")
+        _evaluar_tabla(_TABLA_CIFRADO, {"main": _ESCANER_CIFRADO_MAIN.presencia(contenido_main)},
+                       errores, advertencias)
         
-        if "aws_kms_key" in contenido_main:
-            if "enable_key_rotation" not in contenido_main:
-                advertencias.append("⚠️ KMS keys deberían tener key rotation habilitado")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_acceso_publico_bloqueado(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_acceso_publico_bloqueado(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """REGLA S2: Validar que acceso público esté bloqueado por defecto"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
         
         # Verificar que variables incluyan block_public_access
         if "block_public_access" not in contenido_variables:
-            errores.append("❌ Variables deben incluir 'block_public_access' con default true")
-        
-        # Verificar implementación para S3
-        if "aws_s3_bucket" in contenido_main:
-            if "aws_s3_bucket_public_access_block" not in contenido_main:
-                errores.append("❌ Buckets S3 deben tener aws_s3_bucket_public_access_block")
+            errores.append(_S2_SIN_BLOCK_PUBLIC_ACCESS)
         
         # Verificar que no haya configuraciones públicas explícitas sin justificación
-        if "public" in contenido_main.lower() and "true" in contenido_main.lower():
-            advertencias.append("⚠️ Configuración pública detectada, verificar que sea intencional")
+        if _RE_PUBLICO_TRUE.search(contenido_main):
+            advertencias.append(_S2_CONFIGURACION_PUBLICA)
         
-        # Verificar security groups restrictivos
-        if "aws_security_group" in contenido_main:
-            if "0.0.0.0/0" in contenido_main:
-                advertencias.append("⚠️ Security group con acceso desde 0.0.0.0/0 detectado")
+        # Verificar S3 y security groups restrictivos
+        _evaluar_tabla(_TABLA_ACCESO_PUBLICO, {"main": _ESCANER_ACCESO_PUBLICO_MAIN.presencia(contenido_main)},
+                       errores, advertencias)
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_force_ssl_tls(self, contenido_main: str, contenido_data: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_force_ssl_tls(self, contenido_main: str, contenido_data: str) -> ResultadoValidacion:
         """REGLA S3: Validar que SSL/TLS esté forzado"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        presentes_main = _ESCANER_SSL_MAIN.presencia(contenido_main)
         
-        # Para S3, verificar política de force SSL
-        if "aws_s3_bucket" in contenido_main:
-            if "force_ssl" not in contenido_main and "SecureTransport" not in contenido_data:
-                errores.append("❌ Buckets S3 deben tener política para forzar SSL/TLS")
+        # Para S3, verificar política de force SSL (puede estar en main.tf o en data.tf)
+        if "aws_s3_bucket" in presentes_main:
+            if "force_ssl" not in presentes_main and "SecureTransport" not in contenido_data:
+                errores.append(_S3_S3_SIN_FORCE_SSL)
         
-        # Verificar que no haya configuraciones HTTP inseguras
-        if "http://" in contenido_main:
-            errores.append("❌ URLs HTTP inseguras detectadas, usar HTTPS")
+        # Verificar configuraciones HTTP inseguras y ALB/ELB con HTTPS
+        _evaluar_tabla(_TABLA_SSL, {"main": presentes_main}, errores, advertencias)
         
-        if "ssl = false" in contenido_main or "tls = false" in contenido_main:
-            errores.append("❌ SSL/TLS deshabilitado detectado")
-        
-        # Verificar ALB/ELB con HTTPS
-        if "aws_lb" in contenido_main or "aws_elb" in contenido_main:
-            if "HTTPS" not in contenido_main and "SSL" not in contenido_main:
-                advertencias.append("⚠️ Load Balancer debería usar HTTPS/SSL")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_politicas_menor_privilegio(self, contenido_variables: str, contenido_data: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_politicas_menor_privilegio(self, contenido_variables: str, contenido_data: str) -> ResultadoValidacion:
         """REGLA S4: Validar políticas de menor privilegio"""
-        errores = []
-        advertencias = []
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        presentes_variables = _ESCANER_PRIVILEGIO_VARIABLES.presencia(contenido_variables)
         
         # Verificar estructura de policy_statements en variables
-        if "policy_statements" not in contenido_variables:
-            advertencias.append("⚠️ Considerar agregar 'policy_statements' para políticas personalizadas")
+        if "policy_statements" not in presentes_variables:
+            advertencias.append(_S4_SIN_POLICY_STATEMENTS)
         else:
             # Verificar estructura correcta
-            if "sid" not in contenido_variables or "effect" not in contenido_variables:
-                errores.append("❌ policy_statements debe incluir 'sid' y 'effect'")
-        
-        # Verificar políticas dinámicas en data.tf
-        if "aws_iam_policy_document" in contenido_data:
-            if "dynamic \"statement\"" not in contenido_data:
-                advertencias.append("⚠️ Considerar usar dynamic statements para políticas flexibles")
-        
-        # Verificar que no haya políticas demasiado permisivas
-        if "*" in contenido_data and "Action" in contenido_data:
-            advertencias.append("⚠️ Política con acciones '*' detectada, verificar que sea necesaria")
+            if "sid" not in presentes_variables or "effect" not in presentes_variables:
+                errores.append(_S4_STATEMENT_SIN_SID_EFFECT)
         
-        # Verificar principios restrictivos
-        if "\"*\"" in contenido_data and "Principal" in contenido_data:
-            advertencias.append("⚠️ Política con Principal '*' detectada, considerar ser más restrictivo")
+        # Verificar políticas dinámicas y permisos demasiado amplios en data.tf
+        _evaluar_tabla(_TABLA_PRIVILEGIO, {"data": _ESCANER_PRIVILEGIO_DATA.presencia(contenido_data)},
+                       errores, advertencias)
         
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        return construir_resultado(errores, advertencias)
 
-    def validar_logging_monitoreo(self, contenido_variables: str, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_logging_monitoreo(self, contenido_variables: str, contenido_main: str) -> ResultadoValidacion:
         """REGLA S5: Validar configuración de logging y monitoreo"""
-        errores = []
-        advertencias = []
-        
-        # Verificar variables de logging
-        if "enable_logging" not in contenido_variables:
-            advertencias.append("⚠️ Considerar agregar 'enable_logging' para auditoría")
-        
-        if "enable_versioning" not in contenido_variables:
-            advertencias.append("⚠️ Considerar agregar 'enable_versioning' para auditoría")
-        
-        # Verificar implementación de versioning para S3
-        if "aws_s3_bucket" in contenido_main:
-            if "aws_s3_bucket_versioning" not in contenido_main:
-                advertencias.append("⚠️ Buckets S3 deberían tener versioning habilitado")
-            
-            if "aws_s3_bucket_logging" not in contenido_main:
-                advertencias.append("⚠️ Buckets S3 deberían tener access logging habilitado")
-        
-        # Verificar CloudTrail para auditoría
-        if "aws_cloudtrail" in contenido_main:
-            if "enable_logging" not in contenido_main:
-                errores.append("❌ CloudTrail debe tener logging habilitado")
-        
-        # Verificar CloudWatch logs
-        if "aws_cloudwatch_log_group" in contenido_main:
-            if "retention_in_days" not in contenido_main:
-                advertencias.append("⚠️ CloudWatch log groups deberían tener retention configurado")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        presentes = {
+            "variables": _ESCANER_LOGGING_VARIABLES.presencia(contenido_variables),
+            "main": _ESCANER_LOGGING_MAIN.presencia(contenido_main)
         }
+        _evaluar_tabla(_TABLA_LOGGING, presentes, errores, advertencias)
+        return construir_resultado(errores, advertencias)
 
-    def validar_configuracion_redes(self, contenido_main: str) -> Dict[str, Any]:
+    @memoizar_por_contenido()
+    def validar_configuracion_redes(self, contenido_main: str) -> ResultadoValidacion:
         """REGLA S6: Validar configuraciones de red seguras"""
-        errores = []
-        advertencias = []
-        
-        # Verificar VPC configuration
-        if "aws_vpc" in contenido_main:
-            if "enable_dns_hostnames" not in contenido_main:
-                advertencias.append("⚠️ VPC debería tener DNS hostnames habilitado")
-            
-            if "enable_dns_support" not in contenido_main:
-                advertencias.append("⚠️ VPC debería tener DNS support habilitado")
-        
-        # Verificar subnets privadas
-        if "aws_subnet" in contenido_main:
-            if "map_public_ip_on_launch" in contenido_main and "true" in contenido_main:
-                advertencias.append("⚠️ Subnets no deberían asignar IPs públicas automáticamente")
-        
-        # Verificar NACLs restrictivos
-        if "aws_network_acl" in contenido_main:
-            if "0.0.0.0/0" in contenido_main:
-                advertencias.append("⚠️ Network ACL con reglas muy permisivas detectado")
-        
-        return {
-            "valido": len(errores) == 0,
-            "errores": errores,
-            "advertencias": advertencias
-        }
+        errores: List[Mensaje] = []
+        advertencias: List[Mensaje] = []
+        _evaluar_tabla(_TABLA_REDES, {"main": _ESCANER_REDES_MAIN.presencia(contenido_main)},
+                       errores, advertencias)
+        return construir_resultado(errores, advertencias)
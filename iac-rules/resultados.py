@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Resultados de validación
+Estructura común (inmutable) que devuelven los validadores de reglas IaC
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Tuple
+
+
+class ResultadoValidacion(NamedTuple):
+    """Resultado de validación de campos fijos (más ligero que un dict por llamada)
+
+    Conserva `get()` y `as_dict()` para los consumidores que tratan los
+    resultados como diccionarios; los campos propios de cada regla van en `extras`.
+    """
+
+    valido: bool
+    errores: Tuple[Any, ...] = ()
+    advertencias: Tuple[Any, ...] = ()
+    extras: Mapping[str, Any] = MappingProxyType({})
+
+    def get(self, clave: str, defecto: Any = None) -> Any:
+        """Acceso por clave como en un dict (campos fijos y luego extras)"""
+        if clave in self._fields and clave != "extras":
+            return getattr(self, clave)
+        return self.extras.get(clave, defecto)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Representación dict equivalente a la de los validadores anteriores"""
+        return {"valido": self.valido, "errores": self.errores, "advertencias": self.advertencias, **self.extras}
+
+    def __reduce__(self):
+        # mappingproxy no se puede serializar con pickle: se envía una copia dict
+        # de extras y se vuelve a envolver al reconstruir (p. ej. desde un pool de procesos)
+        return _reconstruir_resultado, (self.valido, self.errores, self.advertencias, dict(self.extras))
+
+    @classmethod
+    def desde_mapping(cls, resultado: Mapping[str, Any]) -> "ResultadoValidacion":
+        """Adaptar un resultado en forma de dict (campos conocidos + extras)"""
+        extras = {clave: valor for clave, valor in resultado.items() if clave not in _CAMPOS_FIJOS}
+        return cls(
+            valido=resultado.get("valido", False),
+            errores=tuple(resultado.get("errores", ())),
+            advertencias=tuple(resultado.get("advertencias", ())),
+            extras=MappingProxyType(extras) if extras else cls._field_defaults["extras"]
+        )
+
+
+_CAMPOS_FIJOS = frozenset({"valido", "errores", "advertencias"})
+
+
+def _reconstruir_resultado(valido: bool, errores: Tuple[Any, ...], advertencias: Tuple[Any, ...], extras: Dict[str, Any]) -> ResultadoValidacion:
+    """Inverso de ResultadoValidacion.__reduce__"""
+    if extras:
+        return ResultadoValidacion(valido, errores, advertencias, MappingProxyType(extras))
+    return ResultadoValidacion(valido, errores, advertencias)
+
+
+# Resultado compartido para el camino habitual: sin errores ni advertencias
+RESULTADO_OK = ResultadoValidacion(valido=True)
+
+
+def construir_resultado(errores: Iterable[Any], advertencias: Iterable[Any], **extras: Any) -> ResultadoValidacion:
+    """Construir un resultado inmutable (reutiliza RESULTADO_OK si no hay nada que reportar)"""
+    errores = tuple(errores)
+    advertencias = tuple(advertencias)
+    if not errores and not advertencias and not extras:
+        return RESULTADO_OK
+    if extras:
+        return ResultadoValidacion(not errores, errores, advertencias, MappingProxyType(extras))
+    return ResultadoValidacion(not errores, errores, advertencias)
+
+
+def como_dict(resultado: Any) -> Dict[str, Any]:
+    """Copia dict de un resultado, sea ResultadoValidacion o un Mapping"""
+    if isinstance(resultado, ResultadoValidacion):
+        return resultado.as_dict()
+    return dict(resultado)
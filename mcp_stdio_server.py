@@ -10,8 +10,14 @@ import json
 import sys
 import logging
 import os
+import select
+from functools import partial
 from typing import Dict, Any, List
-from pydantic import BaseModel
+
+try:
+    import orjson  # opcional: (de)serialización JSON más rápida
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
 
 # Importar el manager de reglas IaC refactorizado
 from iac_rules import ReglasIaCManager
@@ -24,19 +30,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class MCPRequest(BaseModel):
-    """Modelo para las peticiones MCP"""
-    jsonrpc: str = "2.0"
-    id: int
-    method: str
-    params: Dict[str, Any] = {}
+# Bytes leídos de stdin en cada llamada (puede traer varias peticiones encadenadas)
+_READ_SIZE = 65536
+
+
+def _parse_json(line: bytes) -> Any:
+    """Parsear una línea JSON-RPC (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serializar una respuesta JSON-RPC a bytes (orjson si está disponible)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _input_pending(fd: int) -> bool:
+    """True si la entrada ya tiene más datos listos para leer (sin bloquear)"""
+    try:
+        ready, _, _ = select.select([fd], [], [], 0)
+    except (OSError, ValueError):
+        # Sin select sobre pipes (p. ej. Windows): se vacía tras cada respuesta
+        return False
+    return bool(ready)
+
+
+def _response(request_id: Any, result: Dict[str, Any] = None, error: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Respuesta JSON-RPC (siempre con result y error, como espera el cliente)"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": result if result is not None else {},
+        "error": error
+    }
 
-class MCPResponse(BaseModel):
-    """Modelo para las respuestas MCP"""
-    jsonrpc: str = "2.0"
-    id: int
-    result: Dict[str, Any] = {}
-    error: Dict[str, Any] = None
 
 class MCPStdioServer:
     """Clase principal del servidor MCP para stdio con reglas IaC modulares"""
@@ -44,9 +74,16 @@ class MCPStdioServer:
     def __init__(self):
         self.tools = {}
         self.resources = {}
+        self._output = bytearray()  # respuestas pendientes de enviar
         self.reglas_manager = ReglasIaCManager()  # Usar el manager refactorizado
         self._register_tools()
-        logger.info(f"MCP CloudOps v{self.reglas_manager.version} con estructura modular inicializado")
+        # Despacho de métodos JSON-RPC
+        self._methods = {
+            "initialize": self.handle_initialize,
+            "tools/list": self.handle_tools_list,
+            "tools/call": self.handle_tools_call
+        }
+        logger.info("MCP CloudOps v%s con estructura modular inicializado", self.reglas_manager.version)
     
     def _register_tools(self):
         """Registra todas las herramientas disponibles usando el manager refactorizado"""
@@ -267,6 +304,16 @@ class MCPStdioServer:
                 "required": ["ruta_modulo"]
             }
         }
+        
+        # La lista de herramientas es estática: la respuesta de tools/list se arma una sola vez
+        # (cada entrada ya tiene exactamente name, description e inputSchema)
+        self._tools_list_response = {"tools": list(self.tools.values())}
+        # Despacho de herramientas: saludo es local, el resto lo resuelve el manager
+        self._tool_handlers = {
+            nombre: partial(self.reglas_manager.ejecutar_herramienta, nombre)
+            for nombre in self.tools
+        }
+        self._tool_handlers["saludo"] = self._tool_saludo
     
     def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Maneja la inicialización del servidor MCP"""
@@ -286,40 +333,21 @@ class MCPStdioServer:
     def handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Lista todas las herramientas disponibles"""
         logger.info("Listando herramientas disponibles")
-        tools_list = []
-        for tool_name, tool_info in self.tools.items():
-            tools_list.append({
-                "name": tool_info["name"],
-                "description": tool_info["description"],
-                "inputSchema": tool_info["inputSchema"]
-            })
-        return {"tools": tools_list}
+        return self._tools_list_response
     
     def handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Ejecuta una herramienta específica usando el manager refactorizado"""
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
         
-        logger.info(f"Ejecutando herramienta: {tool_name} con argumentos: {arguments}")
+        logger.info("Ejecutando herramienta: %s con argumentos: %s", tool_name, arguments)
         
-        if tool_name not in self.tools:
+        handler = self._tool_handlers.get(tool_name)
+        if handler is None:
             raise Exception(f"Herramienta desconocida: {tool_name}")
         
-        # Herramienta de saludo (para pruebas)
-        if tool_name == "saludo":
-            nombre = arguments.get("nombre", "Usuario")
-            return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"¡Hola {nombre}! 👋 Soy tu servidor MCP CloudOps v{self.reglas_manager.version} especializado en reglas IaC para Terraform. ¿En qué puedo ayudarte hoy?"
-                    }
-                ]
-            }
-        
-        # Delegar al manager de reglas IaC refactorizado
         try:
-            resultado = self.reglas_manager.ejecutar_herramienta(tool_name, arguments)
+            resultado = handler(arguments)
             return {
                 "content": [
                     {
@@ -329,66 +357,85 @@ class MCPStdioServer:
                 ]
             }
         except Exception as e:
-            logger.error(f"Error ejecutando herramienta {tool_name}: {str(e)}")
+            logger.error("Error ejecutando herramienta %s: %s", tool_name, e)
             raise Exception(f"Error ejecutando {tool_name}: {str(e)}")
     
+    def _tool_saludo(self, arguments: Dict[str, Any]) -> str:
+        """Herramienta de saludo (para pruebas)"""
+        nombre = arguments.get("nombre", "Usuario")
+        return f"¡Hola {nombre}! 👋 Soy tu servidor MCP CloudOps v{self.reglas_manager.version} especializado en reglas IaC para Terraform. ¿En qué puedo ayudarte hoy?"
+    
+    def _write(self, response: Dict[str, Any]) -> None:
+        """Encolar una respuesta (una línea JSON); se envía en el siguiente _flush"""
+        self._output += _dump_json(response)
+        self._output += b"\n"
+    
+    def _flush(self) -> None:
+        """Enviar a stdout las respuestas pendientes con una sola escritura"""
+        if self._output:
+            sys.stdout.buffer.write(self._output)
+            sys.stdout.buffer.flush()
+            self._output.clear()
+    
+    def _handle_line(self, line: bytes) -> None:
+        """Procesar una línea JSON-RPC y encolar su respuesta"""
+        line = line.strip()
+        if not line:
+            return
+        
+        request_id = 0
+        try:
+            # Parsear petición JSON-RPC (sólo se usan method, id y params)
+            request = _parse_json(line)
+            request_id = request.get("id", 0)
+            method = request.get("method")
+            
+            logger.info("Procesando: %s", method)
+            
+            # Procesar petición
+            handler = self._methods.get(method)
+            if handler is None:
+                raise Exception(f"Método desconocido: {method}")
+            result = handler(request.get("params") or {})
+            
+            # Enviar respuesta a stdout
+            self._write(_response(request_id, result=result))
+            
+        except json.JSONDecodeError as e:
+            logger.error("Error decodificando JSON: %s", e)
+            self._write(_response(0, error={"code": -32700, "message": f"Parse error: {str(e)}"}))
+            
+        except Exception as e:
+            logger.error("Error procesando petición: %s", e)
+            self._write(_response(request_id, error={"code": -32603, "message": f"Internal error: {str(e)}"}))
+    
     def run(self):
         """Ejecuta el servidor MCP usando stdio"""
         logger.info("Iniciando servidor MCP stdio...")
         
+        # Se lee del descriptor directamente: con readline() el buffer de Python se
+        # queda con las peticiones encadenadas y select ya no las ve pendientes
+        fd = sys.stdin.fileno()
+        pending = b""
         try:
-            for line in sys.stdin:
-                line = line.strip()
-                if not line:
-                    continue
+            while (chunk := os.read(fd, _READ_SIZE)):
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    self._handle_line(line)
                 
-                try:
-                    # Parsear petición JSON-RPC
-                    request_data = json.loads(line)
-                    request = MCPRequest(**request_data)
-                    
-                    logger.info(f"Procesando: {request.method}")
-                    
-                    # Procesar petición
-                    if request.method == "initialize":
-                        result = self.handle_initialize(request.params)
-                    elif request.method == "tools/list":
-                        result = self.handle_tools_list(request.params)
-                    elif request.method == "tools/call":
-                        result = self.handle_tools_call(request.params)
-                    else:
-                        raise Exception(f"Método desconocido: {request.method}")
-                    
-                    # Crear respuesta
-                    response = MCPResponse(
-                        id=request.id,
-                        result=result
-                    )
-                    
-                    # Enviar respuesta a stdout
-                    print(json.dumps(response.model_dump()), flush=True)
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"Error decodificando JSON: {e}")
-                    error_response = MCPResponse(
-                        id=0,
-                        error={"code": -32700, "message": f"Parse error: {str(e)}"}
-                    )
-                    print(json.dumps(error_response.model_dump()), flush=True)
-                    
-                except Exception as e:
-                    logger.error(f"Error procesando petición: {e}")
-                    error_response = MCPResponse(
-                        id=request.id if 'request' in locals() else 0,
-                        error={"code": -32603, "message": f"Internal error: {str(e)}"}
-                    )
-                    print(json.dumps(error_response.model_dump()), flush=True)
+                # Si el cliente ya envió más peticiones, se responden juntas en un solo flush
+                if not _input_pending(fd):
+                    self._flush()
+            
+            # Última petición sin salto de línea final
+            self._handle_line(pending)
                     
         except KeyboardInterrupt:
             logger.info("Servidor interrumpido por el usuario")
         except Exception as e:
-            logger.error(f"Error fatal en el servidor: {e}")
+            logger.error("Error fatal en el servidor: %s", e)
         finally:
+            self._flush()
             logger.info("Servidor MCP stdio terminado")
 
 if __name__ == "__main__":
@@ -0,0 +1,20 @@
+"""
+Pruebas del paquete de reglas IaC
+El directorio del paquete es `iac-rules`; si `iac_rules` no es importable se carga desde el repositorio
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+try:
+    import iac_rules  # noqa: F401
+except ImportError:
+    _DIRECTORIO_PAQUETE = Path(__file__).resolve().parent.parent / "iac-rules"
+    _spec = importlib.util.spec_from_file_location(
+        "iac_rules", _DIRECTORIO_PAQUETE / "__init__.py",
+        submodule_search_locations=[str(_DIRECTORIO_PAQUETE)]
+    )
+    _paquete = importlib.util.module_from_spec(_spec)
+    sys.modules["iac_rules"] = _paquete
+    _spec.loader.exec_module(_paquete)
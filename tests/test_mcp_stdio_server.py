@@ -0,0 +1,63 @@
+"""Pruebas del servidor MCP stdio: respuestas agrupadas para peticiones encadenadas"""
+
+import json
+import os
+import threading
+import unittest
+from unittest import mock
+
+import mcp_stdio_server
+from mcp_stdio_server import MCPStdioServer
+
+
+class _SalidaRegistrada:
+    """Sustituto de sys.stdout que registra cada escritura en `buffer`"""
+
+    def __init__(self):
+        self.buffer = self
+        self.escrituras = []
+        self.escrito = threading.Event()
+
+    def write(self, datos):
+        self.escrituras.append(bytes(datos))
+        self.escrito.set()
+        return len(datos)
+
+    def flush(self):
+        pass
+
+
+class RunTest(unittest.TestCase):
+
+    def test_lote_encadenado_se_envia_en_una_escritura(self):
+        servidor = MCPStdioServer()
+        lectura, escritura = os.pipe()
+        salida = _SalidaRegistrada()
+        entrada = mock.Mock()
+        entrada.fileno.return_value = lectura
+        peticiones = b"".join(
+            json.dumps({"jsonrpc": "2.0", "id": i, "method": "tools/list"}).encode("utf-8") + b"\n"
+            for i in range(5)
+        )
+
+        with mock.patch.object(mcp_stdio_server.sys, "stdin", entrada), \
+                mock.patch.object(mcp_stdio_server.sys, "stdout", salida):
+            hilo = threading.Thread(target=servidor.run)
+            hilo.start()
+            try:
+                # El cliente mantiene la entrada abierta: el lote debe salir sin esperar al EOF
+                os.write(escritura, peticiones)
+                self.assertTrue(salida.escrito.wait(10))
+            finally:
+                os.close(escritura)
+                hilo.join(10)
+                os.close(lectura)
+
+        self.assertFalse(hilo.is_alive())
+        self.assertEqual(len(salida.escrituras), 1)
+        respuestas = [json.loads(linea) for linea in salida.escrituras[0].splitlines()]
+        self.assertEqual([respuesta["id"] for respuesta in respuestas], list(range(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+"""Pruebas del parser de Terraform y de las reglas que lo consumen (A1/A3/B3/D4)"""
+
+import unittest
+
+from iac_rules.parser_terraform import parsear_terraform
+from iac_rules.reglas_avanzadas import ReglasAvanzadas
+from iac_rules.reglas_basicas import ReglasBasicas
+from iac_rules.reglas_documentacion import ReglasDocumentacion
+
+# Módulo de referencia; los resultados esperados son los de las reglas basadas en regex (línea base)
+_VARIABLES = '''variable "client" {
+  description = "Cliente"
+  type        = string
+  validation {
+    condition     = can(regex("^[a-z]+$", var.client))
+    error_message = "Solo minusculas."
+  }
+}
+
+variable "project" {
+  description = "Proyecto"
+  type        = string
+}
+
+variable "environment" {
+  type = string
+  validation {
+    condition     = contains(["dev", "qa", "pdn"], var.environment)
+    error_message = "Ambiente no permitido."
+  }
+}
+
+variable "bucket_config" {
+  description = "Buckets a crear"
+  type = map(object({
+    name = string
+  }))
+}
+
+variable "tags" {
+  description = "Tags adicionales"
+  type        = map(any)
+}
+
+variable "ingress_rules" {
+  type = map(string)
+}
+'''
+
+_OUTPUTS = '''output "bucket_arn" {
+  description = "ARN del bucket"
+  value       = aws_s3_bucket.this.arn
+}
+
+output "bucket_ids" {
+  value = { for k, v in aws_s3_bucket.this : k => v.id }
+}
+'''
+
+
+def _textos(mensajes):
+    return [str(mensaje) for mensaje in mensajes]
+
+
+class ParserTerraformTest(unittest.TestCase):
+
+    def test_heredoc_con_llaves_no_altera_el_bloque(self):
+        contenido = (
+            'variable "policy" {\n'
+            '  description = <<-EOT\n'
+            '    Política con } y { sueltas\n'
+            '  EOT\n'
+            '  type = string\n'
+            '}\n'
+            '\n'
+            'variable "client" {\n'
+            '  type = string\n'
+            '}\n'
+        )
+        archivo = parsear_terraform(contenido)
+
+        self.assertEqual([v.nombre for v in archivo.variables], ["policy", "client"])
+        self.assertEqual(archivo.variables[0].tipo, "string")
+        self.assertTrue(archivo.variables[0].define_atributo("description"))
+
+    def test_crlf_equivale_a_lf(self):
+        crlf = _VARIABLES.replace("\n", "\r\n")
+        archivo = parsear_terraform(crlf)
+
+        self.assertEqual([v.nombre for v in archivo.variables], [v.nombre for v in parsear_terraform(_VARIABLES).variables])
+        self.assertEqual(archivo.variables_por_nombre["tags"].tipo, "map(any)")
+        self.assertEqual(
+            ReglasAvanzadas().validar_tipos_datos_inteligentes(crlf).as_dict(),
+            ReglasAvanzadas().validar_tipos_datos_inteligentes(_VARIABLES).as_dict()
+        )
+
+    def test_llaves_dentro_de_cadenas(self):
+        contenido = (
+            'variable "separador" {\n'
+            '  default = "}{"\n'
+            '  description = "Prefijo ${var.client}-{x}"\n'
+            '}\n'
+            '\n'
+            'output "nombre" {\n'
+            '  value = "${local.prefix}}"\n'
+            '}\n'
+        )
+        archivo = parsear_terraform(contenido)
+
+        self.assertEqual([v.nombre for v in archivo.variables], ["separador"])
+        self.assertTrue(archivo.variables[0].define_atributo("description"))
+        self.assertEqual([o.nombre for o in archivo.outputs], ["nombre"])
+        self.assertTrue(archivo.outputs[0].cerrado)
+
+    def test_bloque_sin_cerrar(self):
+        contenido = 'variable "client" {\n  description = "Cliente"\n  type = string\n'
+        variable, = parsear_terraform(contenido).variables
+
+        self.assertFalse(variable.cerrado)
+        # Como la línea base: A3/A1 no evalúan un bloque incompleto; B3/D4 sí lo ven declarado
+        self.assertEqual(_textos(ReglasAvanzadas().validar_validaciones_variables(contenido).errores), [])
+        self.assertEqual(ReglasAvanzadas().validar_tipos_datos_inteligentes(contenido).get("variables_analizadas"), 0)
+        self.assertEqual(
+            _textos(ReglasBasicas().validar_variables_obligatorias(contenido).errores),
+            ["❌ Variable obligatoria faltante: project", "❌ Variable obligatoria faltante: environment"]
+        )
+        self.assertTrue(ReglasDocumentacion.validar_descriptions_obligatorios(contenido, "").valido)
+
+        # El bloque sin cerrar termina en la siguiente cabecera de primer nivel y ésta se analiza
+        contenido += (
+            '\nvariable "environment" {\n  description = "Entorno"\n  type = string\n'
+            '  validation {\n    condition = contains(["dev", "qa", "pdn"], var.environment)\n'
+            '    error_message = "Entorno no válido"\n  }\n}\n'
+        )
+        variable, environment = parsear_terraform(contenido).variables
+
+        self.assertFalse(variable.cerrado)
+        self.assertEqual((environment.nombre, environment.tipo, environment.cerrado), ("environment", "string", True))
+        self.assertNotIn("environment", variable.cuerpo)
+        self.assertEqual(ReglasAvanzadas().validar_tipos_datos_inteligentes(contenido).get("variables_analizadas"), 1)
+        self.assertEqual(_textos(ReglasAvanzadas().validar_validaciones_variables(contenido).advertencias), [])
+        self.assertEqual(
+            _textos(ReglasBasicas().validar_variables_obligatorias(contenido).errores),
+            ["❌ Variable obligatoria faltante: project"]
+        )
+        self.assertEqual(
+            ReglasDocumentacion.validar_descriptions_obligatorios(contenido, "").get("variables_analizadas"), 2
+        )
+
+
+class ParidadLineaBaseTest(unittest.TestCase):
+    """Mismos hallazgos que las reglas regex originales sobre un módulo bien formado"""
+
+    def test_a1_tipos_datos(self):
+        resultado = ReglasAvanzadas().validar_tipos_datos_inteligentes(_VARIABLES)
+
+        self.assertEqual(_textos(resultado.errores), [])
+        self.assertEqual(_textos(resultado.advertencias), [
+            "⚠️ Variable 'tags' debería usar map(string) para tags",
+            "⚠️ Variable 'ingress_rules' podría necesitar list(object()) para configuraciones múltiples",
+        ])
+        self.assertEqual(resultado.get("variables_analizadas"), 6)
+
+    def test_a3_validaciones(self):
+        resultado = ReglasAvanzadas().validar_validaciones_variables(_VARIABLES)
+
+        self.assertEqual(_textos(resultado.errores), ["❌ Variable crítica 'project' debe tener validación"])
+        self.assertEqual(_textos(resultado.advertencias), [])
+
+    def test_b3_variables_obligatorias(self):
+        resultado = ReglasBasicas().validar_variables_obligatorias(_VARIABLES)
+
+        self.assertEqual(_textos(resultado.errores), ["❌ Variable 'environment' sin description obligatorio"])
+        self.assertEqual(list(resultado.get("variables_encontradas")), ["client", "project", "environment"])
+
+    def test_d4_descriptions(self):
+        resultado = ReglasDocumentacion.validar_descriptions_obligatorios(_VARIABLES, _OUTPUTS)
+
+        self.assertEqual(_textos(resultado.errores), [
+            "❌ Variable 'environment' sin description obligatorio",
+            "❌ Variable 'ingress_rules' sin description obligatorio",
+            "❌ Output 'bucket_ids' sin description obligatorio",
+        ])
+        self.assertEqual(resultado.get("variables_analizadas"), 6)
+        self.assertEqual(resultado.get("outputs_analizados"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
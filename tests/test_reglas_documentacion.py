@@ -0,0 +1,56 @@
+"""Pruebas de ReglasDocumentacion.validar_lote (pool de procesos)"""
+
+import os
+import tempfile
+import unittest
+
+from iac_rules.mensajes import CodigoMensaje
+from iac_rules.reglas_documentacion import ReglasDocumentacion
+from iac_rules.resultados import ResultadoValidacion
+
+_README = ReglasDocumentacion.obtener_plantilla_readme_completa("modulo-prueba", "bucket")
+_CHANGELOG = "# Changelog\n\n## [1.0.0] - 2024-01-01\n\n### Added\n- N/A\n"
+_SAMPLE_README = "# Ejemplo de Uso\n\nterraform init\nterraform plan\n"
+_VARIABLES = 'variable "client" {\n  type = string\n}\n\nvariable "project" {\n  description = "Proyecto"\n  type = string\n}\n'
+_OUTPUTS = 'output "arn" {\n  value = aws_s3_bucket.this.arn\n}\n'
+
+
+class ValidarLoteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reglas = ReglasDocumentacion()
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta_modulo = directorio.name
+        with open(os.path.join(self.ruta_modulo, ".terraform-docs.yml"), "w", encoding="utf-8") as f:
+            f.write("formatter: markdown table\n")
+
+    def test_lote_en_procesos_igual_a_validacion_directa(self):
+        casos = [
+            ("readme", [_README], self.reglas.validar_readme_estructura_completa),
+            ("changelog", [_CHANGELOG], self.reglas.validar_changelog_formato_completo),
+            ("sample_readme", [_SAMPLE_README], self.reglas.validar_sample_readme),
+            ("terraform_docs", [self.ruta_modulo], self.reglas.validar_terraform_docs_configuracion),
+            ("descriptions", [_VARIABLES, _OUTPUTS], self.reglas.validar_descriptions_obligatorios),
+        ]
+        items = [{"tipo": tipo, "argumentos": argumentos} for tipo, argumentos, _ in casos]
+
+        resultados = self.reglas.validar_lote(items, max_workers=2)
+
+        self.assertEqual(len(resultados), len(casos))
+        for (tipo, argumentos, validador), resultado in zip(casos, resultados):
+            with self.subTest(tipo=tipo):
+                self.assertIsInstance(resultado, ResultadoValidacion)
+                self.assertEqual(resultado.as_dict(), validador(*argumentos).as_dict())
+                self.assertNotIn(CodigoMensaje.D_LOTE_ERROR_EJECUCION, [e.codigo for e in resultado.errores])
+
+    def test_tipo_no_reconocido(self):
+        resultado, = self.reglas.validar_lote([{"tipo": "inexistente", "argumentos": []}], max_workers=2)
+
+        self.assertFalse(resultado.valido)
+        self.assertEqual(resultado.errores[0].codigo, CodigoMensaje.D_LOTE_TIPO_NO_RECONOCIDO)
+        self.assertEqual(str(resultado.errores[0]), "❌ Tipo de validación no reconocido: inexistente")
+
+
+if __name__ == "__main__":
+    unittest.main()
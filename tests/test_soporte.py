@@ -0,0 +1,166 @@
+"""Pruebas de los módulos compartidos: caché, escaneo de literales, resultados, mensajes y pools"""
+
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from iac_rules import ReglasIaCManager
+from iac_rules import escaneo_literales
+from iac_rules.cache_resultados import memoizar_por_contenido
+from iac_rules.escaneo_literales import EscanerLiterales
+from iac_rules.mensajes import CodigoMensaje, mensaje
+from iac_rules.reglas_seguridad import ReglasSeguridad
+from iac_rules.resultados import RESULTADO_OK, ResultadoValidacion, construir_resultado
+
+
+class MemoizarPorContenidoTest(unittest.TestCase):
+
+    def test_posicion_y_nombre_comparten_entrada(self):
+        llamadas = []
+
+        class Reglas:
+            @memoizar_por_contenido()
+            def validar(self, contenido_a: str, contenido_b: str = "") -> str:
+                llamadas.append((contenido_a, contenido_b))
+                return contenido_a + contenido_b
+
+        reglas = Reglas()
+        self.assertEqual(reglas.validar("x", "y"), "xy")
+        self.assertEqual(reglas.validar(contenido_a="x", contenido_b="y"), "xy")
+        self.assertEqual(reglas.validar("x", contenido_b="y"), "xy")
+        self.assertEqual(reglas.validar("x"), reglas.validar("x", ""))
+        self.assertEqual(llamadas, [("x", "y"), ("x", "")])
+
+    def test_validador_de_seguridad_por_nombre(self):
+        reglas = ReglasSeguridad()
+        por_nombre = reglas.validar_cifrado_obligatorio(contenido_variables="a", contenido_main="b")
+
+        self.assertIs(por_nombre, reglas.validar_cifrado_obligatorio("a", "b"))
+        with self.assertRaises(TypeError):
+            reglas.validar_cifrado_obligatorio("a")
+
+
+class EscanerLiteralesTest(unittest.TestCase):
+
+    LITERALES = ("aws_s3_bucket", "aws_s3_bucket_versioning", "0.0.0.0/0", "ñandú", "")
+    TEXTOS = (
+        "",
+        'resource "aws_s3_bucket" "this" {}',
+        'resource "aws_s3_bucket_versioning" "v" {}\ncidr = "0.0.0.0/0"',
+        "ñandú",
+    )
+
+    def _comprobar_equivalencia(self, escaner):
+        for texto in self.TEXTOS:
+            with self.subTest(texto=texto):
+                esperados = {literal for literal in self.LITERALES if literal in texto}
+                self.assertEqual(escaner.presentes(texto), esperados)
+                presencia = escaner.presencia(texto)
+                self.assertEqual({literal for literal in self.LITERALES if literal in presencia}, esperados)
+                self.assertEqual(escaner.posiciones(texto), {literal: texto.find(literal) for literal in esperados})
+
+    def test_presentes_y_presencia_equivalen_a_in(self):
+        with mock.patch.object(escaneo_literales, "ahocorasick", None):
+            escaner = EscanerLiterales(self.LITERALES)
+        self.assertIsNone(escaner._automata)
+        self._comprobar_equivalencia(escaner)
+
+    @unittest.skipUnless(escaneo_literales.ahocorasick is not None, "pyahocorasick no está instalado")
+    def test_automata_equivale_a_in(self):
+        escaner = EscanerLiterales(self.LITERALES)
+        self.assertIsNotNone(escaner._automata)
+        self._comprobar_equivalencia(escaner)
+
+    def test_sin_automata_la_presencia_es_perezosa(self):
+        with mock.patch.object(escaneo_literales, "ahocorasick", None):
+            escaner = EscanerLiterales(("aws_vpc", "enable_dns_support"))
+        self.assertNotIsInstance(escaner.presencia("aws_vpc"), frozenset)
+        self.assertIn("aws_vpc", escaner.presencia("aws_vpc"))
+        self.assertNotIn("enable_dns_support", escaner.presencia("aws_vpc"))
+
+
+class ResultadosTest(unittest.TestCase):
+
+    def test_pickle_conserva_extras_de_solo_lectura(self):
+        for resultado in (
+            RESULTADO_OK,
+            construir_resultado([mensaje(CodigoMensaje.A4_SIN_PROVIDER_AWS)], [], recursos_analizados=3),
+        ):
+            with self.subTest(resultado=resultado):
+                copia = pickle.loads(pickle.dumps(resultado))
+                self.assertEqual(copia, resultado)
+                with self.assertRaises(TypeError):
+                    copia.extras["nuevo"] = 1
+
+    def test_get_y_as_dict(self):
+        resultado = construir_resultado([], ["aviso"], versiones_encontradas=("1.0.0",))
+
+        self.assertIs(construir_resultado([], []), RESULTADO_OK)
+        self.assertTrue(resultado.get("valido"))
+        self.assertEqual(resultado.get("versiones_encontradas"), ("1.0.0",))
+        self.assertIsNone(resultado.get("inexistente"))
+        self.assertEqual(ResultadoValidacion.desde_mapping(resultado.as_dict()), resultado)
+
+    def test_mensaje_se_renderiza_con_su_plantilla(self):
+        self.assertEqual(str(mensaje(CodigoMensaje.B3_VARIABLE_FALTANTE, "client")), "❌ Variable obligatoria faltante: client")
+        for codigo in CodigoMensaje:
+            with self.subTest(codigo=codigo):
+                str(mensaje(codigo, *("x",) * 2))
+
+
+class ManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(directorio.cleanup)
+        self.ruta_modulo = directorio.name
+        self.manager = ReglasIaCManager()
+
+    def _escribir(self, archivo: str, contenido: str) -> None:
+        ruta = os.path.join(self.ruta_modulo, archivo)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as f:
+            f.write(contenido)
+
+    def test_validar_modulo_en_procesos_igual_a_llamadas_directas(self):
+        archivos = {
+            "variables.tf": 'variable "client" {\n  type = string\n}\n',
+            "main.tf": 'resource "aws_s3_bucket" "this" {\n  bucket = local.resource_names["s3"]\n}\n',
+            "locals.tf": "locals {\n  resource_names = {}\n}\n",
+            "outputs.tf": 'output "arn" {\n  value = aws_s3_bucket.this.arn\n}\n',
+            "providers.tf": 'provider "aws" {}\n',
+            "data.tf": "",
+            "README.md": "# Modulo\n",
+            "CHANGELOG.md": "# Changelog\n",
+            os.path.join("sample", "README.md"): "terraform init\n",
+        }
+        for archivo, contenido in archivos.items():
+            self._escribir(archivo, contenido)
+
+        reporte = self.manager.validar_modulo(self.ruta_modulo, max_workers=2)
+
+        directo = {
+            "tipos_datos": self.manager.validar_tipos_datos_inteligentes(archivos["variables.tf"]),
+            "cifrado_obligatorio": self.manager.validar_cifrado_obligatorio(archivos["variables.tf"], archivos["main.tf"]),
+            "readme_estructura": self.manager.validar_readme_estructura_completa(archivos["README.md"]),
+        }
+        for nombre, resultado in directo.items():
+            with self.subTest(validacion=nombre):
+                self.assertEqual(reporte["validaciones"][nombre], resultado.as_dict())
+        for nombre, registro in reporte["validaciones"].items():
+            with self.subTest(validacion=nombre):
+                self.assertFalse(any("Error ejecutando" in str(error) for error in registro["errores"]))
+
+    def test_fail_fast_corta_en_la_primera_validacion_invalida(self):
+        completo = self.manager.generar_reporte_validacion_completo(self.ruta_modulo)
+        corto = self.manager.generar_reporte_validacion_completo(self.ruta_modulo, fail_fast=True)
+
+        self.assertEqual(list(completo["validaciones"]), ["estructura_modulo", "terraform_docs_config"])
+        self.assertEqual(list(corto["validaciones"]), ["estructura_modulo"])
+        self.assertFalse(corto["resumen"]["validacion_exitosa"])
+
+
+if __name__ == "__main__":
+    unittest.main()